@@ -1,3 +1,11 @@
-from conduit.conduit import PhabricatorConfig, main
-
 __all__ = ["PhabricatorConfig", "main"]
+
+
+def __getattr__(name):
+    # The MCP server pulls in fastmcp, which is slow to import. Load it on
+    # first use so importing conduit.client or conduit.utils stays cheap.
+    if name in __all__:
+        from conduit import conduit
+
+        return getattr(conduit, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,98 @@
+import copy
 import json
+import random
+import threading
+import time
 import urllib.parse
 from abc import ABC
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import httpx
 
 from conduit.utils import PhabricatorAPIError
+from conduit.utils.parameters import _hashable
+
+try:
+    # Conduit responses for searches and raw diffs can be large; orjson decodes
+    # them several times faster than the standard library when installed.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # HTTP/2 multiplexes concurrent requests over one connection; httpx only
+    # supports it when the optional h2 package (the http2 extra) is installed.
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Tool calls fan out into bursts of concurrent requests to the same server.
+# Keeping every pooled connection alive between bursts lets the next one
+# reuse warm TLS sessions instead of reconnecting beyond httpx's default 20.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=100, keepalive_expiry=30.0
+)
+
+# Conduit returns at most this many results per *.search page, so lookups
+# by a longer list of IDs or PHIDs are split into several searches.
+_MAX_SEARCH_LIMIT = 100
+
+# Conduit method name fragments that identify side-effect free calls. Only
+# these are coalesced, so concurrent identical writes are still all sent.
+_READ_ONLY_SUFFIXES = ("search", "query")
+_READ_ONLY_PREFIXES = ("query", "get")
+_READ_ONLY_NAMES = frozenset(
+    {"info", "whoami", "ping", "download", "blame", "resolverefs", "lookup"}
+)
+
+# Transient failures are retried with exponential backoff. Writes are only
+# retried when the server cannot have acted on them (see _post).
+_MAX_RETRIES = 3
+_RETRY_DELAY = 0.5
+_RETRY_BACKOFF = 2.0
+_MAX_RETRY_AFTER = 30.0
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Read-only requests currently being sent, shared by every client instance so
+# SSE mode, which builds a new client per request, still coalesces duplicates.
+# Keys include the server URL and token, so only the same user's calls merge.
+_IN_FLIGHT: Dict[Any, Future] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+def _is_read_only_method(method: str) -> bool:
+    """Check whether a Conduit method only reads data."""
+    name = method.rsplit(".", 1)[-1]
+    return (
+        name.endswith(_READ_ONLY_SUFFIXES)
+        or name.startswith(_READ_ONLY_PREFIXES)
+        or name in _READ_ONLY_NAMES
+    )
+
+
+def _chunks(items: List[Any], size: int = _MAX_SEARCH_LIMIT) -> List[List[Any]]:
+    """Split ``items`` into consecutive lists of at most ``size`` items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _retry_after(response: httpx.Response, default: float) -> float:
+    """Seconds to wait before retrying, honouring a numeric Retry-After."""
+    try:
+        return min(float(response.headers["Retry-After"]), _MAX_RETRY_AFTER)
+    except (KeyError, ValueError):
+        return default
 
 
 class BasePhabricatorClient(ABC):
     def __init__(
-        self, api_url: str, api_token: str, http_client: Optional[httpx.Client] = None
+        self,
+        api_url: str,
+        api_token: str,
+        http_client: Optional[httpx.Client] = None,
+        max_retries: int = _MAX_RETRIES,
     ):
         """
         Initialize the base Phabricator client.
@@ -19,9 +101,11 @@ class BasePhabricatorClient(ABC):
             api_url: Base URL for the Phabricator API
             api_token: API token for authentication
             http_client: Optional httpx client to reuse
+            max_retries: Retries for transient failures, 0 to fail at once
         """
         self.api_url = api_url.rstrip("/") + "/"
         self.api_token = api_token
+        self.max_retries = max_retries
         self._owns_client = http_client is None
 
         if http_client is None:
@@ -32,6 +116,8 @@ class BasePhabricatorClient(ABC):
                 },
                 timeout=30.0,
                 follow_redirects=True,
+                http2=_HTTP2,
+                limits=_POOL_LIMITS,
             )
         else:
             self.client = http_client
@@ -42,6 +128,11 @@ class BasePhabricatorClient(ABC):
         """
         Make a request to the Phabricator API.
 
+        Identical read-only requests issued concurrently from several threads
+        with the same server and token are coalesced, even across client
+        instances: only the first one is sent and the others wait for and
+        share its result.
+
         Args:
             method: API method name (e.g., 'maniphest.search')
             params: Parameters to send with the request, every value is JSON formatted
@@ -56,15 +147,72 @@ class BasePhabricatorClient(ABC):
         if params is None:
             params = {}
 
-        params["api.token"] = self.api_token
+        key = self._coalesce_key(method, params)
+        if key is None:
+            return self._send_request(method, params)
 
-        url = urllib.parse.urljoin(self.api_url, method)
+        with _IN_FLIGHT_LOCK:
+            future = _IN_FLIGHT.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = _IN_FLIGHT[key] = Future()
+
+        if not is_leader:
+            # Callers are free to mutate their result, so hand out a copy.
+            return copy.deepcopy(future.result())
 
         try:
-            response = self.client.post(url, data=params)
+            result = self._send_request(method, params)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _IN_FLIGHT_LOCK:
+                del _IN_FLIGHT[key]
+
+    def _coalesce_key(self, method: str, params: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Build the in-flight table key for a request.
+
+        Returns:
+            Hashable key, or None if the request must not be coalesced
+        """
+        if not _is_read_only_method(method):
+            return None
+
+        try:
+            key = (
+                self.api_url,
+                self.api_token,
+                method,
+                tuple(sorted((k, _hashable(v)) for k, v in params.items())),
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _send_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a single request to the Phabricator API.
+
+        Args:
+            method: API method name (e.g., 'maniphest.search')
+            params: Parameters to send with the request
+
+        Returns:
+            Response data from the API
+        """
+        params["api.token"] = self.api_token
+
+        try:
+            response = self._post(method, params)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
 
             if data.get("error_code"):
                 raise PhabricatorAPIError(
@@ -80,6 +228,74 @@ class BasePhabricatorClient(ABC):
         except json.JSONDecodeError as e:
             raise PhabricatorAPIError(f"Invalid JSON response: {str(e)}")
 
+    def _post(self, method: str, params: Dict[str, Any]) -> httpx.Response:
+        """
+        POST a request, retrying transient failures with exponential backoff.
+
+        Read-only methods are retried on any transport error and on 429 and
+        5xx gateway responses. Writes are only retried when the request
+        provably did not run: the connection was never made, or the server
+        rate limited it.
+
+        Args:
+            method: API method name (e.g., 'maniphest.search')
+            params: Form parameters to send
+
+        Returns:
+            The last HTTP response received
+        """
+        url = urllib.parse.urljoin(self.api_url, method)
+        read_only = _is_read_only_method(method)
+        delay = _RETRY_DELAY
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                response = self.client.post(url, data=params)
+            except httpx.TransportError as e:
+                # A write that timed out may still have been applied
+                retryable = read_only or isinstance(
+                    e, (httpx.ConnectError, httpx.ConnectTimeout)
+                )
+                if last_attempt or not retryable:
+                    raise
+                wait = delay
+            else:
+                status = response.status_code
+                retryable = status in _RETRY_STATUSES and (read_only or status == 429)
+                if last_attempt or not retryable:
+                    return response
+                wait = _retry_after(response, delay)
+
+            # Jitter keeps concurrent callers from retrying in lockstep
+            time.sleep(wait * random.uniform(1.0, 1.5))
+            delay *= _RETRY_BACKOFF
+
+    @staticmethod
+    def _map_concurrently(
+        func: Callable[[Any], Any], items: Iterable[Any], max_workers: int
+    ) -> List[Any]:
+        """
+        Apply ``func`` to every item using a bounded pool of threads.
+
+        The shared httpx client is thread-safe, so independent requests can
+        overlap instead of paying one round trip after another.
+
+        Args:
+            func: Function to call for each item
+            items: Items to process
+            max_workers: Maximum number of calls in flight at once
+
+        Returns:
+            Results, in the same order as ``items``
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            return list(pool.map(func, items))
+
     def close(self):
         """Close the HTTP client if we own it."""
         if self._owns_client and self.client:
@@ -0,0 +1,73 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class RequestCache:
+    """Simple request cache with TTL support."""
+
+    def __init__(self, ttl: int = 300, max_size: Optional[int] = None):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _canonicalize(value: Any) -> str:
+        """Create a stable string representation suitable for cache keys."""
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list, tuple, set)):
+            try:
+                return json.dumps(value, sort_keys=True, default=str)
+            except TypeError:
+                return str(value)
+        return str(value)
+
+    def _generate_key(
+        self,
+        method: str,
+        url: str,
+        params: dict = None,
+        data: dict = None,
+        json_payload: Any = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        """Generate cache key from request parameters."""
+        key_parts = [
+            method.upper(),
+            url,
+            self._canonicalize(params),
+            self._canonicalize(data),
+            self._canonicalize(json_payload),
+            self._canonicalize(extra),
+        ]
+        key_data = "|".join(key_parts)
+        return hashlib.md5(key_data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached response if still valid."""
+        with self._lock:
+            if key in self._cache:
+                cached_data, timestamp = self._cache.pop(key)
+                if time.time() - timestamp < self.ttl:
+                    # Re-insert to mark the entry as most recently used.
+                    self._cache[key] = (cached_data, timestamp)
+                    return cached_data
+        return None
+
+    def set(self, key: str, value: Any):
+        """Cache response with timestamp."""
+        with self._lock:
+            self._cache.pop(key, None)
+            self._cache[key] = (value, time.time())
+            if self.max_size is not None and len(self._cache) > self.max_size:
+                # Evict the least recently used entry.
+                del self._cache[next(iter(self._cache))]
+
+    def clear(self):
+        """Clear all cached responses."""
+        with self._lock:
+            self._cache.clear()
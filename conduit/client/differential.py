@@ -165,8 +165,7 @@ class DifferentialClient(BasePhabricatorClient):
 
         # Flatten changes properly
         if changes:
-            flattened_changes = dict(flatten_params(changes, "changes"))
-            params.update(flattened_changes)
+            params.update(flatten_params(changes, "changes"))
 
         return self._make_request("differential.creatediff", params)
 
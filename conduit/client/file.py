@@ -1,6 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from conduit.client.base import BasePhabricatorClient, PhabricatorAPIError
+from conduit.client.base import BasePhabricatorClient, PhabricatorAPIError, _chunks
 from conduit.utils import build_search_params
 
 
@@ -28,6 +28,9 @@ class FileClient(BasePhabricatorClient):
         """
         Get information about a file.
 
+        This is a convenience wrapper for single lookups. Use `get_files` to
+        fetch several files in one request.
+
         Args:
             file_phid: PHID of the file
 
@@ -43,6 +46,46 @@ class FileClient(BasePhabricatorClient):
         else:
             raise PhabricatorAPIError(f"File {file_phid} not found")
 
+    def get_files(
+        self, file_phids: List[str], max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Get information about several files with as few search requests as possible.
+
+        PHIDs are searched in pages of up to 100, concurrently when there are
+        more than that. Each distinct PHID is fetched once; a duplicated PHID
+        repeats the same file in the result.
+
+        Args:
+            file_phids: PHIDs of the files
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            File information, in the same order as `file_phids`
+
+        Raises:
+            PhabricatorAPIError: If any of the files could not be found
+        """
+        if not file_phids:
+            return []
+
+        results = self._map_concurrently(
+            lambda phids: self.search_files(
+                constraints={"phids": phids}, limit=len(phids)
+            ),
+            _chunks(list(dict.fromkeys(file_phids))),
+            max_workers,
+        )
+        index = {
+            item["phid"]: item for result in results for item in result.get("data", [])
+        }
+
+        missing = [phid for phid in file_phids if phid not in index]
+        if missing:
+            raise PhabricatorAPIError(f"Files not found: {', '.join(missing)}")
+
+        return [index[phid] for phid in file_phids]
+
     def allocate_file(
         self, name: str, length: int, content_hash: str = None
     ) -> Dict[str, Any]:
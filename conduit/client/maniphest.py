@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional, Union
 
-from conduit.client.base import BasePhabricatorClient
+from conduit.client.base import BasePhabricatorClient, PhabricatorAPIError, _chunks
 from conduit.client.types import (
     PHID,
     ManiphestSearchAttachments,
@@ -58,6 +58,9 @@ class ManiphestClient(BasePhabricatorClient):
         """
         Get a specific task by ID.
 
+        This is a convenience wrapper for single lookups. Use `get_tasks` to
+        fetch several tasks in one request.
+
         Args:
             task_id: Task ID to retrieve
 
@@ -68,6 +71,50 @@ class ManiphestClient(BasePhabricatorClient):
 
         return self._make_request("maniphest.info", params)
 
+    def get_tasks(
+        self, task_ids: List[Union[int, str]], max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Get several tasks by ID with as few search requests as possible.
+
+        IDs are searched in pages of up to 100, concurrently when there are
+        more than that. Each distinct ID is fetched once; a duplicated ID
+        repeats the same task in the result.
+
+        Args:
+            task_ids: Task IDs to retrieve, as integers or numeric strings
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Task search results, in the same order as `task_ids`
+
+        Raises:
+            PhabricatorAPIError: If any of the tasks could not be found
+        """
+        if not task_ids:
+            return []
+
+        # maniphest.createtask reports IDs as strings, maniphest.search as ints
+        task_ids = [int(task_id) for task_id in task_ids]
+        results = self._map_concurrently(
+            lambda ids: self.search_tasks(constraints={"ids": ids}, limit=len(ids)),
+            _chunks(list(dict.fromkeys(task_ids))),
+            max_workers,
+        )
+        index = {
+            int(task["id"]): task
+            for result in results
+            for task in result.get("data", [])
+        }
+
+        missing = [task_id for task_id in task_ids if task_id not in index]
+        if missing:
+            raise PhabricatorAPIError(
+                f"Tasks not found: {', '.join(str(i) for i in missing)}"
+            )
+
+        return [index[task_id] for task_id in task_ids]
+
     def create_task(
         self,
         title: str,
@@ -97,6 +144,57 @@ class ManiphestClient(BasePhabricatorClient):
         Returns:
             Created task data
         """
+        params = self._build_create_task_params(
+            title=title,
+            description=description,
+            owner_phid=owner_phid,
+            view_policy=view_policy,
+            edit_policy=edit_policy,
+            cc_phids=cc_phids,
+            priority=priority,
+            project_phids=project_phids,
+            auxiliary=auxiliary,
+        )
+
+        return self._make_request("maniphest.createtask", params)
+
+    def create_tasks(
+        self, specs: List[Dict[str, Any]], max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several Maniphest tasks concurrently.
+
+        Conduit has no multi-object create endpoint, so the requests are sent
+        in parallel over the shared HTTP client instead of one after another.
+
+        Args:
+            specs: Keyword arguments for `create_task`, one dict per task
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Created task data, in the same order as `specs`
+        """
+        params_list = [self._build_create_task_params(**spec) for spec in specs]
+
+        return self._map_concurrently(
+            lambda params: self._make_request("maniphest.createtask", params),
+            params_list,
+            max_workers,
+        )
+
+    @staticmethod
+    def _build_create_task_params(
+        title: str,
+        description: Optional[str] = "",
+        owner_phid: Optional[str] = None,
+        view_policy: Optional[Union[PHID, PolicyID]] = None,
+        edit_policy: Optional[Union[PHID, PolicyID]] = None,
+        cc_phids: Optional[List[PHID]] = None,
+        priority: Optional[int] = None,
+        project_phids: Optional[List[PHID]] = None,
+        auxiliary: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the maniphest.createtask parameters for a single task."""
         params = {"title": title}
 
         if description:
@@ -124,9 +222,7 @@ class ManiphestClient(BasePhabricatorClient):
             params["auxiliary"] = auxiliary
 
         # Serialize list and dict fields to JSON
-        params = serialize_json_params(params)
-
-        return self._make_request("maniphest.createtask", params)
+        return serialize_json_params(params)
 
     def edit_task(
         self,
@@ -144,17 +240,11 @@ class ManiphestClient(BasePhabricatorClient):
         Returns:
             Task data (created or updated)
         """
-        params = {}
+        params = build_transaction_params(transactions=transactions)
 
         if object_identifier is not None:
             params["objectIdentifier"] = object_identifier
 
-        if transactions:
-            params = build_transaction_params(
-                transactions=transactions,
-                object_identifier=object_identifier,
-            )
-
         return self._make_request("maniphest.edit", params)
 
     def get_task_transactions(self, task_id: int) -> Dict[str, Any]:
@@ -1,10 +1,75 @@
-from typing import Any, Dict, List
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Optional
+
+import httpx
 
 from conduit.client.base import BasePhabricatorClient
+from conduit.client.cache import RequestCache
 from conduit.utils import build_search_params, build_transaction_params
 
+# (transaction type, always sent) for the fields accepted by create_project
+_CREATE_FIELDS = (
+    ("name", True),
+    ("description", False),
+    ("icon", False),
+    ("color", False),
+)
+
 
 class ProjectClient(BasePhabricatorClient):
+    def __init__(
+        self,
+        api_url: str,
+        api_token: str,
+        http_client: Optional[httpx.Client] = None,
+        cache_ttl: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the project client.
+
+        Args:
+            api_url: Base URL for the Phabricator API
+            api_token: API token for authentication
+            http_client: Optional httpx client to reuse
+            cache_ttl: Cache read results for this many seconds (disabled if None)
+            **kwargs: Further BasePhabricatorClient arguments, such as max_retries
+        """
+        super().__init__(api_url, api_token, http_client, **kwargs)
+        self._search_cache = (
+            RequestCache(ttl=cache_ttl, max_size=256) if cache_ttl else None
+        )
+
+    def _cached_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Make a read-only request, serving repeated identical calls from cache.
+
+        Args:
+            method: API method name (e.g., 'project.search')
+            params: Parameters to send with the request
+
+        Returns:
+            Response data from the API
+        """
+        if self._search_cache is None:
+            return self._make_request(method, params)
+
+        key = self._search_cache._generate_key("POST", method, data=params)
+        cached = self._search_cache.get(key)
+        if cached is None:
+            cached = self._make_request(method, params)
+            self._search_cache.set(key, cached)
+
+        # Callers may modify the result, so never hand out the cached object.
+        return copy.deepcopy(cached)
+
+    def clear_cache(self):
+        """Drop all cached read results."""
+        if self._search_cache is not None:
+            self._search_cache.clear()
+
     def search_projects(
         self, constraints: Dict[str, Any] = None, limit: int = 100
     ) -> Dict[str, Any]:
@@ -22,7 +87,30 @@ class ProjectClient(BasePhabricatorClient):
             constraints=constraints,
             limit=limit,
         )
-        return self._make_request("project.search", params)
+        return self._cached_request("project.search", params)
+
+    def search_projects_many(
+        self,
+        constraints_list: List[Dict[str, Any]],
+        limit: int = 100,
+        concurrency: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several project searches concurrently.
+
+        Args:
+            constraints_list: Search constraints, one dict per search
+            limit: Maximum number of results to return per search
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Search results, in the same order as `constraints_list`
+        """
+        return self._map_concurrently(
+            lambda constraints: self.search_projects(constraints, limit),
+            constraints_list,
+            concurrency,
+        )
 
     def edit_project(
         self, transactions: List[Dict[str, Any]], object_identifier: str = None
@@ -41,7 +129,10 @@ class ProjectClient(BasePhabricatorClient):
             transactions=transactions,
             object_identifier=object_identifier,
         )
-        return self._make_request("project.edit", params)
+        try:
+            return self._make_request("project.edit", params)
+        finally:
+            self.clear_cache()
 
     def create_project(
         self, name: str, description: str = "", icon: str = None, color: str = None
@@ -58,16 +149,51 @@ class ProjectClient(BasePhabricatorClient):
         Returns:
             Created project data
         """
-        transactions = [{"type": "name", "value": name}]
+        transactions = self._build_create_transactions(name, description, icon, color)
+        return self.edit_project(transactions)
 
-        if description:
-            transactions.append({"type": "description", "value": description})
-        if icon:
-            transactions.append({"type": "icon", "value": icon})
-        if color:
-            transactions.append({"type": "color", "value": color})
+    def create_projects_bulk(
+        self, specs: List[Dict[str, Any]], concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several projects concurrently.
 
-        return self.edit_project(transactions)
+        Conduit has no batch endpoint, so the project.edit requests are sent
+        in parallel over the shared HTTP client instead of one after another.
+
+        Args:
+            specs: Keyword arguments for `create_project`, one dict per project
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Created project data, in the same order as `specs`
+        """
+        transactions_list = [self._build_create_transactions(**spec) for spec in specs]
+
+        try:
+            return self._map_concurrently(
+                lambda transactions: self._make_request(
+                    "project.edit",
+                    build_transaction_params(transactions=transactions),
+                ),
+                transactions_list,
+                concurrency,
+            )
+        finally:
+            self.clear_cache()
+
+    @staticmethod
+    def _build_create_transactions(
+        name: str, description: str = "", icon: str = None, color: str = None
+    ) -> List[Dict[str, Any]]:
+        """Build the project.edit transactions for a new project."""
+        return [
+            {"type": field, "value": value}
+            for (field, required), value in zip(
+                _CREATE_FIELDS, (name, description, icon, color)
+            )
+            if required or value
+        ]
 
     def search_columns(
         self, constraints: Dict[str, Any] = None, limit: int = 100
@@ -86,7 +212,30 @@ class ProjectClient(BasePhabricatorClient):
             constraints=constraints,
             limit=limit,
         )
-        return self._make_request("project.column.search", params)
+        return self._cached_request("project.column.search", params)
+
+    def search_columns_many(
+        self,
+        constraints_list: List[Dict[str, Any]],
+        limit: int = 100,
+        concurrency: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several workboard column searches concurrently.
+
+        Args:
+            constraints_list: Search constraints, one dict per search
+            limit: Maximum number of results to return per search
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Column information, in the same order as `constraints_list`
+        """
+        return self._map_concurrently(
+            lambda constraints: self.search_columns(constraints, limit),
+            constraints_list,
+            concurrency,
+        )
 
     def query_projects(self, constraints: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -99,7 +248,7 @@ class ProjectClient(BasePhabricatorClient):
             Query results
         """
         params = constraints or {}
-        return self._make_request("project.query", params)
+        return self._cached_request("project.query", params)
 
     def create_column(
         self, project_phid: str, name: str, limit: int = None
@@ -124,7 +273,10 @@ class ProjectClient(BasePhabricatorClient):
             transactions.append({"type": "limit", "value": str(limit)})
 
         params = build_transaction_params(transactions=transactions)
-        return self._make_request("project.column.create", params)
+        try:
+            return self._make_request("project.column.create", params)
+        finally:
+            self.clear_cache()
 
     def edit_column(
         self, column_phid: str, transactions: List[Dict[str, Any]]
@@ -142,7 +294,10 @@ class ProjectClient(BasePhabricatorClient):
         params = build_transaction_params(
             transactions=transactions, object_identifier=column_phid
         )
-        return self._make_request("project.column.edit", params)
+        try:
+            return self._make_request("project.column.edit", params)
+        finally:
+            self.clear_cache()
 
     def delete_column(self, column_phid: str) -> Dict[str, Any]:
         """
@@ -155,7 +310,10 @@ class ProjectClient(BasePhabricatorClient):
             Deletion result
         """
         params = {"objectIdentifier": column_phid}
-        return self._make_request("project.column.delete", params)
+        try:
+            return self._make_request("project.column.delete", params)
+        finally:
+            self.clear_cache()
 
     # Convenience methods for common column operations
     def update_column_name(self, column_phid: str, new_name: str) -> Dict[str, Any]:
@@ -0,0 +1,82 @@
+import hashlib
+import time
+
+import httpx
+import pytest
+
+from conduit.client.base import PhabricatorAPIError
+from conduit.client.misc import ConduitClient
+from conduit.client.user import UserClient
+
+# How long a cached whoami() result is reused across test runs
+WHOAMI_CACHE_TTL = 3600
+
+
+@pytest.fixture(scope="session")
+def phabricator_server():
+    """
+    Skip live-server tests unless the configured Phorge instance answers.
+
+    The server is pinged once per session with a short timeout, so a missing
+    or unreachable server skips every dependent test immediately instead of
+    each test waiting for its own connection timeout.
+    """
+    # Imported here so collecting the offline tests never loads the MCP server
+    from conduit.conduit import get_config
+
+    try:
+        config = get_config()
+    except ValueError as e:
+        pytest.skip(f"Phabricator server not configured: {e}")
+
+    with httpx.Client(timeout=5.0) as http_client:
+        try:
+            # No retries: an unreachable server should skip at once
+            ConduitClient(config.url, config.token, http_client, max_retries=0).ping()
+        except PhabricatorAPIError as e:
+            # Conduit errors carry an error code; a missing one means the
+            # request never got a Conduit response at all
+            if e.error_code is None:
+                pytest.skip(f"Phabricator server unreachable: {e}")
+
+
+@pytest.fixture(scope="session")
+def whoami_info(request, phabricator_server):
+    """
+    Current user info, persisted in pytest's cache between runs.
+
+    The cache entry is keyed on the server URL and token so switching either
+    fetches a fresh user, and it expires after ``WHOAMI_CACHE_TTL`` seconds.
+    Run pytest with ``--cache-clear`` to force a refresh.
+    """
+    from conduit.conduit import get_config
+
+    config = get_config()
+    cache = getattr(request.config, "cache", None)
+    digest = hashlib.sha256(f"{config.url}\0{config.token}".encode()).hexdigest()
+    key = f"conduit/whoami/{digest[:16]}"
+
+    if cache is not None:
+        entry = cache.get(key, None)
+        if entry and time.time() - entry["fetched"] < WHOAMI_CACHE_TTL:
+            return entry["user"]
+
+    with UserClient(config.url, config.token) as cli:
+        user = cli.whoami()
+
+    if cache is not None:
+        cache.set(key, {"fetched": time.time(), "user": user})
+    return user
+
+
+@pytest.fixture(scope="class")
+def phabricator_user(request, whoami_info):
+    """Expose the current user to a TestCase class as ``cls.user``."""
+    request.cls.user = whoami_info
+
+
+def pytest_collection_modifyitems(items):
+    """Mark every test that needs the live server as an integration test."""
+    for item in items:
+        if "phabricator_server" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.integration)
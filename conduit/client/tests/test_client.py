@@ -1,6 +1,17 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
+from unittest.mock import patch
 
-from conduit.utils import flatten_params
+import httpx
+
+from conduit.client.base import BasePhabricatorClient, PhabricatorAPIError
+from conduit.utils import (
+    build_search_params,
+    build_transaction_params,
+    flatten_params,
+)
+from conduit.utils.parameters import _flatten_constraints
 
 
 class TestBasePhabricatorClient(TestCase):
@@ -27,3 +38,188 @@ class TestBasePhabricatorClient(TestCase):
                     ("test[1][a]", 4),
                 ],
             )
+
+    def test_flatten_constraints_cached(self):
+        constraints = {"ids": [1, 2], "query": "foo"}
+
+        with self.subTest("matches_uncached"):
+            flatten = _flatten_constraints(constraints, "constraints")
+            self.assertEqual(
+                list(flatten), flatten_params(constraints, prefix="constraints")
+            )
+
+        with self.subTest("reuses_result"):
+            self.assertIs(
+                _flatten_constraints(dict(constraints), "constraints"), flatten
+            )
+
+        with self.subTest("bool_and_int_not_conflated"):
+            self.assertEqual(
+                _flatten_constraints({"isAdmin": True}, "constraints"),
+                (("constraints[isAdmin]", True),),
+            )
+            flatten = _flatten_constraints({"isAdmin": 1}, "constraints")
+            self.assertIs(flatten[0][1], 1)
+
+        with self.subTest("unhashable_falls_back"):
+            flatten = _flatten_constraints({"raw": bytearray(b"x")}, "c")
+            self.assertEqual(flatten, (("c[raw]", bytearray(b"x")),))
+
+        with self.subTest("attachments_share_cache"):
+            flatten = _flatten_constraints({"availability": True}, "attachments")
+            params = build_search_params(attachments={"availability": True})
+            self.assertEqual(params, {"limit": 100, **dict(flatten)})
+            self.assertIs(
+                _flatten_constraints({"availability": True}, "attachments"), flatten
+            )
+
+    def test_build_transaction_params(self):
+        params = build_transaction_params(
+            transactions=[{"type": "name", "value": "repo"}],
+            object_identifier="R1",
+        )
+        self.assertEqual(
+            params,
+            {
+                "objectIdentifier": "R1",
+                "transactions[0][type]": "name",
+                "transactions[0][value]": "repo",
+            },
+        )
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        calls = []
+        # Released on every entry into the in-flight table: once by the
+        # request that is sent and once by the caller that joins it
+        entered = threading.Semaphore(0)
+
+        class TrackingLock(object):
+            def __init__(self):
+                self._lock = threading.Lock()
+
+            def __enter__(self):
+                self._lock.acquire()
+                entered.release()
+
+            def __exit__(self, *exc_info):
+                self._lock.release()
+
+        def handler(request):
+            calls.append(request.url.path)
+            # Hold the response until the second caller has found this
+            # request in flight, so the calls are sure to overlap
+            for _ in range(2):
+                self.assertTrue(entered.acquire(timeout=5))
+            return httpx.Response(200, json={"result": {"data": [1, 2]}})
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        client = BasePhabricatorClient("http://test/api/", "token", http_client)
+        # SSE mode builds a new client per request for the same user
+        same_user = BasePhabricatorClient("http://test/api/", "token", http_client)
+
+        lock = TrackingLock()
+        with patch("conduit.client.base._IN_FLIGHT_LOCK", lock):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(
+                    client._make_request, "diffusion.branchquery", {"r": 1}
+                )
+                second = pool.submit(
+                    same_user._make_request, "diffusion.branchquery", {"r": 1}
+                )
+
+                with self.subTest("single_round_trip"):
+                    self.assertEqual(first.result(), second.result())
+                    self.assertEqual(calls, ["/api/diffusion.branchquery"])
+
+                with self.subTest("results_are_independent"):
+                    self.assertIsNot(first.result(), second.result())
+
+        with self.subTest("writes_not_coalesced"):
+            self.assertIsNone(client._coalesce_key("maniphest.edit", {}))
+            self.assertIsNotNone(client._coalesce_key("maniphest.search", {}))
+
+        with self.subTest("other_tokens_not_coalesced"):
+            other_user = BasePhabricatorClient("http://test/api/", "other", http_client)
+            self.assertNotEqual(
+                other_user._coalesce_key("maniphest.search", {}),
+                client._coalesce_key("maniphest.search", {}),
+            )
+
+    def test_response_decoding(self):
+        def handler(request):
+            if request.url.path.endswith("conduit.ping"):
+                return httpx.Response(200, json={"result": "ok"})
+            return httpx.Response(200, content=b"<html>not json</html>")
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        client = BasePhabricatorClient("http://test/api/", "token", http_client)
+
+        with self.subTest("valid_json"):
+            self.assertEqual(client._make_request("conduit.ping"), "ok")
+
+        with self.subTest("invalid_json"):
+            with self.assertRaisesRegex(PhabricatorAPIError, "Invalid JSON"):
+                client._make_request("user.whoami")
+
+    @patch("conduit.client.base.time.sleep")
+    def test_transient_failures_are_retried(self, sleep):
+        def make_client(*responses, **kwargs):
+            calls = []
+            responses = iter(responses)
+
+            def handler(request):
+                calls.append(request.url.path)
+                response = next(responses)
+                if isinstance(response, Exception):
+                    raise response
+                return response
+
+            http_client = httpx.Client(transport=httpx.MockTransport(handler))
+            client = BasePhabricatorClient(
+                "http://test/api/", "token", http_client, **kwargs
+            )
+            return client, calls
+
+        ok = httpx.Response(200, json={"result": "ok"})
+
+        with self.subTest("read_retried_on_5xx"):
+            client, calls = make_client(httpx.Response(503), ok)
+            self.assertEqual(client._make_request("maniphest.search"), "ok")
+            self.assertEqual(len(calls), 2)
+
+        with self.subTest("write_not_retried_on_5xx"):
+            client, calls = make_client(httpx.Response(503), ok)
+            with self.assertRaises(PhabricatorAPIError):
+                client._make_request("maniphest.edit")
+            self.assertEqual(len(calls), 1)
+
+        with self.subTest("write_retried_when_rate_limited"):
+            sleep.reset_mock()
+            client, calls = make_client(
+                httpx.Response(429, headers={"Retry-After": "2"}), ok
+            )
+            self.assertEqual(client._make_request("maniphest.edit"), "ok")
+            self.assertEqual(len(calls), 2)
+            self.assertGreaterEqual(sleep.call_args[0][0], 2)
+
+        with self.subTest("write_retried_when_not_sent"):
+            client, calls = make_client(httpx.ConnectError("refused"), ok)
+            self.assertEqual(client._make_request("maniphest.edit"), "ok")
+
+        with self.subTest("write_not_retried_on_read_timeout"):
+            client, calls = make_client(httpx.ReadTimeout("slow"), ok)
+            with self.assertRaises(PhabricatorAPIError):
+                client._make_request("maniphest.edit")
+            self.assertEqual(len(calls), 1)
+
+        with self.subTest("retries_disabled"):
+            client, calls = make_client(httpx.ConnectError("refused"), max_retries=0)
+            with self.assertRaises(PhabricatorAPIError):
+                client._make_request("conduit.ping")
+            self.assertEqual(len(calls), 1)
+
+        with self.subTest("gives_up_after_max_retries"):
+            client, calls = make_client(*[httpx.Response(503)] * 4)
+            with self.assertRaises(PhabricatorAPIError):
+                client._make_request("maniphest.search")
+            self.assertEqual(len(calls), 4)
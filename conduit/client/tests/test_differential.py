@@ -1,26 +1,32 @@
 import time
 from unittest import TestCase
 
+import pytest
+
 from conduit.client.base import PhabricatorAPIError
 from conduit.client.differential import DifferentialClient
 from conduit.client.diffusion import DiffusionClient
-from conduit.conduit import get_config
 
 
+@pytest.mark.usefixtures("phabricator_server")
 class TestDifferentialClient(TestCase):
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from conduit.conduit import get_config
+
         config = get_config()
-        self.cli = DifferentialClient(config.url, config.token)
-        self.diffusion_cli = DiffusionClient(config.url, config.token)
+        cls.cli = DifferentialClient(config.url, config.token)
+        cls.diffusion_cli = DiffusionClient(config.url, config.token)
 
-        # Create test data
-        self.test_diff_id = None
-        self.test_revision_id = None
-        self._setup_test_data()
+        # Create one test diff and revision shared by every test in the class
+        cls.test_diff_id, cls.test_revision_id = cls._create_test_data()
 
-    def _setup_test_data(self):
+    @classmethod
+    def _create_test_data(cls):
         """Create test diff and revision for testing"""
+        test_diff_id = None
+        test_revision_id = None
         try:
             # Create a test diff
             diff_content = """diff --git a/test_file.py b/test_file.py
@@ -32,13 +38,13 @@ index 0000000..8b13789
 +# Test file for differential testing
 """
 
-            diff_result = self.cli.create_raw_diff(diff=diff_content)
+            diff_result = cls.cli.create_raw_diff(diff=diff_content)
             if "id" in diff_result:
-                self.test_diff_id = diff_result["id"]
+                test_diff_id = diff_result["id"]
                 diff_phid = diff_result.get("phid")
 
                 # Create a test revision using PHID
-                revision_result = self.cli.edit_revision(
+                revision_result = cls.cli.edit_revision(
                     transactions=[
                         {"type": "title", "value": f"Test Revision {int(time.time())}"},
                         {"type": "summary", "value": "Test revision for unit testing"},
@@ -48,11 +54,13 @@ index 0000000..8b13789
                 )
 
                 if "object" in revision_result:
-                    self.test_revision_id = revision_result["object"]["id"]
+                    test_revision_id = revision_result["object"]["id"]
 
         except Exception as e:
             print(f"Failed to create test data: {e}")
 
+        return test_diff_id, test_revision_id
+
     def test_search_revisions(self):
         """Test revision searching"""
         with self.subTest("Search all revisions"):
@@ -230,11 +238,13 @@ Reviewers: #test-group
 
     def test_close_revision_legacy(self):
         """Test closing revisions using legacy method"""
-        if not self.test_revision_id:
+        # Closing changes the revision state, so don't touch the shared one
+        _, revision_id = self._create_test_data()
+        if not revision_id:
             self.skipTest("No test revision available")
 
         try:
-            result = self.cli.close_revision(revision_id=self.test_revision_id)
+            result = self.cli.close_revision(revision_id=revision_id)
             self.assertIsInstance(result, dict)
         except PhabricatorAPIError:
             # Legacy method might not work or revision might not be closeable
@@ -301,11 +311,14 @@ index 0000000..ce01362
             pass
 
 
+@pytest.mark.usefixtures("phabricator_server")
 class TestDifferentialWorkflows(TestCase):
     """Test complete differential workflows"""
 
     def setUp(self):
         super().setUp()
+        from conduit.conduit import get_config
+
         config = get_config()
         self.cli = DifferentialClient(config.url, config.token)
 
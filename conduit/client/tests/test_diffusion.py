@@ -1,80 +1,90 @@
 import os
 import subprocess
 import tempfile
-import time
+import uuid
 from unittest import TestCase
 
+import httpx
+import pytest
+
 from conduit.client.base import PhabricatorAPIError
 from conduit.client.differential import DifferentialClient
 from conduit.client.diffusion import DiffusionClient
-from conduit.conduit import get_config
 
+TEST_REPO_DESCRIPTION = "Test repository for diffusion client tests"
 
-class TestDiffusionClient(TestCase):
-    def setUp(self):
-        super().setUp()
-        config = get_config()
-        self.cli = DiffusionClient(config.url, config.token)
-        self.diff_cli = DifferentialClient(config.url, config.token)
+GIT_SETUP_SCRIPT = """
+git init -q
+git add README.md src/main.py
+git -c user.name="Test User" -c user.email=test@example.com commit -q -m "Initial commit"
+git add src/utils.py
+git -c user.name="Test User" -c user.email=test@example.com commit -q -m "Add utils module"
+"""
 
-        # Create a test repository for our tests
-        self.test_repo = None
-        self.test_repo_path = None
-        self._setup_test_repository()
 
-    def _setup_test_repository(self):
+@pytest.mark.usefixtures("phabricator_server")
+class TestDiffusionClient(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from conduit.conduit import get_config
+
+        config = get_config()
+        # One pooled connection is reused by both clients for the whole class
+        cls.http_client = httpx.Client(timeout=30.0, follow_redirects=True)
+        cls.addClassCleanup(cls.http_client.close)
+        cls.cli = DiffusionClient(config.url, config.token, cls.http_client)
+        cls.diff_cli = DifferentialClient(config.url, config.token, cls.http_client)
+
+        # Create one test repository shared by every test in the class
+        cls.test_repo = None
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.test_repo_path = cls._tmp.name
+        cls._setup_test_repository()
+        cls.repo_phid = cls.test_repo["object"]["phid"] if cls.test_repo else None
+
+    @classmethod
+    def _setup_test_repository(cls):
         """Create a test git repository for testing"""
         try:
             # Create a test repository
-            repo_name = f"test-repo-{int(time.time())}"
-            self.test_repo = self.cli.create_repository(
+            repo_name = f"test-repo-{uuid.uuid4().hex[:8]}"
+            cls.test_repo = cls.cli.create_repository(
                 name=repo_name,
                 vcs_type="git",
-                description="Test repository for diffusion client tests",
-            )
-
-            # Create a temporary directory for git operations
-            self.test_repo_path = tempfile.mkdtemp()
-
-            # Initialize git repo and create some test content
-            os.chdir(self.test_repo_path)
-            subprocess.run(["git", "init"], check=True)
-            subprocess.run(["git", "config", "user.name", "Test User"], check=True)
-            subprocess.run(
-                ["git", "config", "user.email", "test@example.com"], check=True
+                description=TEST_REPO_DESCRIPTION,
             )
 
             # Create test files
-            with open("README.md", "w") as f:
+            os.makedirs(os.path.join(cls.test_repo_path, "src"))
+            with open(os.path.join(cls.test_repo_path, "README.md"), "w") as f:
                 f.write("# Test Repository\n\nThis is a test repository.\n")
 
-            os.makedirs("src", exist_ok=True)
-            with open("src/main.py", "w") as f:
+            with open(os.path.join(cls.test_repo_path, "src", "main.py"), "w") as f:
                 f.write(
                     "#!/usr/bin/env python3\n\ndef main():\n    print('Hello, World!')\n\nif __name__ == '__main__':\n    main()\n"
                 )
 
-            # Initial commit
-            subprocess.run(["git", "add", "."], check=True)
-            subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
-
-            # Create a second commit for diff testing
-            with open("src/utils.py", "w") as f:
+            # A second file is committed separately for diff testing
+            with open(os.path.join(cls.test_repo_path, "src", "utils.py"), "w") as f:
                 f.write("def helper_function():\n    return 'helper'\n")
 
-            subprocess.run(["git", "add", "src/utils.py"], check=True)
-            subprocess.run(["git", "commit", "-m", "Add utils module"], check=True)
+            # Build both commits in a single process instead of one per command
+            subprocess.run(
+                ["bash", "-euc", GIT_SETUP_SCRIPT],
+                cwd=cls.test_repo_path,
+                check=True,
+            )
 
         except Exception as e:
             print(f"Failed to setup test repository: {e}")
             # If we can't create a real repo, we'll skip repository-dependent tests
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test resources"""
-        if self.test_repo_path and os.path.exists(self.test_repo_path):
-            import shutil
-
-            shutil.rmtree(self.test_repo_path, ignore_errors=True)
+        cls._tmp.cleanup()
+        super().tearDownClass()
 
     def test_search_repositories(self):
         """Test repository search functionality"""
@@ -92,7 +102,7 @@ class TestDiffusionClient(TestCase):
 
     def test_create_repository(self):
         """Test repository creation"""
-        repo_name = f"test-created-repo-{int(time.time())}"
+        repo_name = f"test-created-repo-{uuid.uuid4().hex[:8]}"
 
         result = self.cli.create_repository(
             name=repo_name,
@@ -109,12 +119,18 @@ class TestDiffusionClient(TestCase):
         if not self.test_repo:
             self.skipTest("No test repository available")
 
-        new_description = f"Updated description {int(time.time())}"
+        new_description = f"Updated description {uuid.uuid4().hex[:8]}"
         transactions = [{"type": "description", "value": new_description}]
 
         result = self.cli.edit_repository(
             transactions=transactions,
-            object_identifier=self.test_repo["object"]["phid"],
+            object_identifier=self.repo_phid,
+        )
+        # The repository is shared across tests, so put the description back
+        self.addCleanup(
+            self.cli.edit_repository,
+            transactions=[{"type": "description", "value": TEST_REPO_DESCRIPTION}],
+            object_identifier=self.repo_phid,
         )
 
         self.assertIn("object", result)
@@ -131,11 +147,9 @@ class TestDiffusionClient(TestCase):
         if not self.test_repo:
             self.skipTest("No test repository available")
 
-        repo_phid = self.test_repo["object"]["phid"]
-
         with self.subTest("Browse repository root"):
             try:
-                result = self.cli.browse_query(repository=repo_phid)
+                result = self.cli.browse_query(repository=self.repo_phid)
                 self.assertIn("pathList", result)
             except PhabricatorAPIError:
                 # Repository might not be fully set up yet
@@ -146,12 +160,10 @@ class TestDiffusionClient(TestCase):
         if not self.test_repo:
             self.skipTest("No test repository available")
 
-        repo_phid = self.test_repo["object"]["phid"]
-
         with self.subTest("Get file content"):
             try:
                 result = self.cli.file_content_query(
-                    repository=repo_phid, path="README.md"
+                    repository=self.repo_phid, path="README.md"
                 )
                 # The exact structure depends on repository setup
                 self.assertIsInstance(result, dict)
@@ -164,11 +176,9 @@ class TestDiffusionClient(TestCase):
         if not self.test_repo:
             self.skipTest("No test repository available")
 
-        repo_phid = self.test_repo["object"]["phid"]
-
         with self.subTest("Get repository history"):
             try:
-                result = self.cli.history_query(repository=repo_phid, limit=10)
+                result = self.cli.history_query(repository=self.repo_phid, limit=10)
                 self.assertIsInstance(result, dict)
             except PhabricatorAPIError:
                 # Repository might not have history yet
@@ -179,11 +189,9 @@ class TestDiffusionClient(TestCase):
         if not self.test_repo:
             self.skipTest("No test repository available")
 
-        repo_phid = self.test_repo["object"]["phid"]
-
         with self.subTest("Get repository branches"):
             try:
-                result = self.cli.branch_query(repository=repo_phid)
+                result = self.cli.branch_query(repository=self.repo_phid)
                 self.assertIsInstance(result, dict)
             except PhabricatorAPIError:
                 # Repository might not be ready
@@ -194,12 +202,10 @@ class TestDiffusionClient(TestCase):
         if not self.test_repo:
             self.skipTest("No test repository available")
 
-        repo_phid = self.test_repo["object"]["phid"]
-
         with self.subTest("Resolve refs"):
             try:
                 result = self.cli.resolve_refs(
-                    repository=repo_phid, refs=["main", "HEAD"]
+                    repository=self.repo_phid, refs=["main", "HEAD"]
                 )
                 self.assertIsInstance(result, dict)
             except PhabricatorAPIError:
@@ -211,8 +217,6 @@ class TestDiffusionClient(TestCase):
         if not self.test_repo:
             self.skipTest("No test repository available")
 
-        repo_phid = self.test_repo["object"]["phid"]
-
         try:
             # 1. Create a raw diff
             diff_content = """diff --git a/test.txt b/test.txt
@@ -225,7 +229,7 @@ index 0000000..ce01362
 """
 
             diff_result = self.diff_cli.create_raw_diff(
-                diff=diff_content, repository_phid=repo_phid
+                diff=diff_content, repository_phid=self.repo_phid
             )
 
             self.assertTrue("id" in diff_result or "diffid" in diff_result)
@@ -258,14 +262,22 @@ index 0000000..ce01362
             print(f"Workflow test failed (expected): {e}")
 
 
+@pytest.mark.usefixtures("phabricator_server")
 class TestDiffusionDifferentialIntegration(TestCase):
     """Integration tests between Diffusion and Differential clients"""
 
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from conduit.conduit import get_config
+
         config = get_config()
-        self.diffusion_cli = DiffusionClient(config.url, config.token)
-        self.differential_cli = DifferentialClient(config.url, config.token)
+        cls.http_client = httpx.Client(timeout=30.0, follow_redirects=True)
+        cls.addClassCleanup(cls.http_client.close)
+        cls.diffusion_cli = DiffusionClient(config.url, config.token, cls.http_client)
+        cls.differential_cli = DifferentialClient(
+            config.url, config.token, cls.http_client
+        )
 
     def test_create_diff_from_repository(self):
         """Test creating a diff using repository data"""
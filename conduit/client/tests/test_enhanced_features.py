@@ -1,12 +1,9 @@
 #!/usr/bin/env python3
 
-import os
-import sys
 import unittest
 from unittest.mock import Mock
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+import httpx
 
 from conduit.client.base import BasePhabricatorClient
 from conduit.utils import RuntimeValidationClient
@@ -88,6 +85,33 @@ class TestNewFeatures(unittest.TestCase):
         self.assertIn("message", stats)
         self.assertIn("Basic client", stats["message"])
 
+    def test_shared_http_client(self):
+        """Test PhabricatorClient reusing a caller-supplied HTTP client."""
+
+        http_client = httpx.Client()
+        self.addCleanup(http_client.close)
+
+        for kwargs in ({}, {"timeout": 60.0}):
+            with self.subTest(**kwargs):
+                client = PhabricatorClient(
+                    api_url="https://test.example.com/api/",
+                    api_token="test_token",
+                    http_client=http_client,
+                    **kwargs,
+                )
+
+                # API clients are only built when first used
+                self.assertNotIn("maniphest", vars(client))
+
+                # Every API client shares the supplied connection pool
+                self.assertIs(client.maniphest.client, http_client)
+                self.assertIs(client.maniphest, client.maniphest)
+                self.assertIs(client.phid.client, http_client)
+
+                # The caller keeps ownership of the HTTP client
+                client.close()
+                self.assertFalse(http_client.is_closed)
+
     def test_client_config_class(self):
         """Test ClientConfig class."""
 
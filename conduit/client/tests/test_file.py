@@ -87,6 +87,76 @@ class TestFileClient:
 
         assert "PHID-NONEXISTENT not found" in str(exc_info.value)
 
+    @patch("conduit.client.base.BasePhabricatorClient._make_request")
+    def test_get_files_preserves_order(self, mock_request):
+        """Test batch file retrieval returns files in requested order."""
+        mock_request.return_value = {
+            "data": [
+                {"phid": "PHID-FILE-1", "name": "test.txt"},
+                {"phid": "PHID-FILE-2", "name": "example.pdf"},
+            ]
+        }
+
+        result = self.client.get_files(["PHID-FILE-2", "PHID-FILE-1"])
+
+        mock_request.assert_called_once_with(
+            "file.search",
+            {
+                "limit": 2,
+                "constraints[phids][0]": "PHID-FILE-2",
+                "constraints[phids][1]": "PHID-FILE-1",
+            },
+        )
+        assert [f["name"] for f in result] == ["example.pdf", "test.txt"]
+
+    @patch("conduit.client.base.BasePhabricatorClient._make_request")
+    def test_get_files_missing(self, mock_request):
+        """Test batch file retrieval when some files are not found."""
+        mock_request.return_value = {"data": [{"phid": "PHID-FILE-1"}]}
+
+        with pytest.raises(PhabricatorAPIError) as exc_info:
+            self.client.get_files(["PHID-FILE-1", "PHID-NONEXISTENT"])
+
+        assert "PHID-NONEXISTENT" in str(exc_info.value)
+
+    @patch("conduit.client.base.BasePhabricatorClient._make_request")
+    def test_get_files_duplicates_fetched_once(self, mock_request):
+        """Test batch file retrieval queries each PHID once."""
+        mock_request.return_value = {"data": [{"phid": "PHID-FILE-1"}]}
+
+        result = self.client.get_files(["PHID-FILE-1", "PHID-FILE-1"])
+
+        mock_request.assert_called_once_with(
+            "file.search",
+            {"limit": 1, "constraints[phids][0]": "PHID-FILE-1"},
+        )
+        assert result == [{"phid": "PHID-FILE-1"}] * 2
+
+    @patch("conduit.client.base.BasePhabricatorClient._make_request")
+    def test_get_files_split_into_pages(self, mock_request):
+        """Test batch file retrieval stays within the 100 result page limit."""
+        phids = [f"PHID-FILE-{i}" for i in range(250)]
+        mock_request.side_effect = lambda method, params: {
+            "data": [
+                {"phid": value}
+                for key, value in params.items()
+                if key.startswith("constraints[phids]")
+            ]
+        }
+
+        result = self.client.get_files(phids)
+
+        # Pages are fetched concurrently, so compare their sizes unordered
+        limits = [call.args[1]["limit"] for call in mock_request.call_args_list]
+        assert sorted(limits) == [50, 100, 100]
+        assert [f["phid"] for f in result] == phids
+
+    @patch("conduit.client.base.BasePhabricatorClient._make_request")
+    def test_get_files_empty(self, mock_request):
+        """Test batch file retrieval with no PHIDs."""
+        assert self.client.get_files([]) == []
+        mock_request.assert_not_called()
+
     @patch("conduit.client.base.BasePhabricatorClient._make_request")
     def test_allocate_file_success(self, mock_request):
         """Test successful file allocation."""
@@ -1,5 +1,8 @@
 from unittest import TestCase
 
+import httpx
+import pytest
+
 from conduit.client.base import PhabricatorAPIError
 from conduit.client.maniphest import ManiphestClient
 from conduit.client.types import (
@@ -20,20 +23,55 @@ from conduit.client.types import (
     ManiphestTaskTransactionTitle,
     UserInfo,
 )
-from conduit.client.user import UserClient
-from conduit.conduit import get_config
 
 
+@pytest.mark.usefixtures("phabricator_server", "phabricator_user")
 class TestManiphestClient(TestCase):
-    def setUp(self):
-        super().setUp()
-        config = get_config()
-        self.cli = ManiphestClient(config.url, config.token)
+    task: ManiphestTaskInfo
+    task2: ManiphestTaskInfo
+    # Injected by the phabricator_user fixture
+    user: UserInfo
 
-        self.user: UserInfo = UserClient(config.url, config.token).whoami()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from conduit.conduit import get_config
+
+        config = get_config()
+        # One pooled connection is reused by both clients for the whole class
+        cls.http_client = httpx.Client(timeout=30.0, follow_redirects=True)
+        cls.addClassCleanup(cls.http_client.close)
+        cls.cli = ManiphestClient(config.url, config.token, cls.http_client)
+
+        # Both fixture tasks are created once for the class, concurrently
+        cls.task, cls.task2 = cls.cli.create_tasks(
+            [{"title": "Test"}, {"title": "Test2"}]
+        )
 
-        self.task: ManiphestTaskInfo = self.cli.create_task("Test")
-        self.task2: ManiphestTaskInfo = self.cli.create_task("Test2")
+        # Relationship edits applied in order by the subtask and parent tests
+        phids = [cls.task2["phid"]]
+        cls.subtask_edits = (
+            [ManiphestTaskTransactionSubtasksAdd(type="subtasks.add", value=phids)],
+            [
+                ManiphestTaskTransactionSubtasksRemove(
+                    type="subtasks.remove", value=phids
+                )
+            ],
+            # subtask remove is idempotent
+            [
+                ManiphestTaskTransactionSubtasksRemove(
+                    type="subtasks.remove", value=phids
+                )
+            ],
+            [ManiphestTaskTransactionSubtasksSet(type="subtasks.set", value=phids)],
+        )
+        cls.parent_edits = (
+            [ManiphestTaskTransactionParentsAdd(type="parents.add", value=phids)],
+            [ManiphestTaskTransactionParentsRemove(type="parents.remove", value=phids)],
+            # parent remove is idempotent
+            [ManiphestTaskTransactionParentsRemove(type="parents.remove", value=phids)],
+            [ManiphestTaskTransactionParentsSet(type="parents.set", value=phids)],
+        )
 
     def test_get_task(self):
         with self.subTest("Get existing task"):
@@ -43,6 +81,25 @@ class TestManiphestClient(TestCase):
             with self.assertRaises(PhabricatorAPIError):
                 self.cli.get_task(0)
 
+    def test_get_tasks(self):
+        with self.subTest("Get existing tasks in requested order"):
+            # createtask reports string IDs, search returns ints
+            tasks = self.cli.get_tasks([self.task2["id"], self.task["id"]])
+            self.assertEqual(
+                [t["id"] for t in tasks], [int(self.task2["id"]), int(self.task["id"])]
+            )
+
+        with self.subTest("Get non-existing Task"):
+            with self.assertRaises(PhabricatorAPIError):
+                self.cli.get_tasks([self.task["id"], 0])
+
+    def test_create_tasks(self):
+        tasks = self.cli.create_tasks(
+            [{"title": "Batch 1"}, {"title": "Batch 2", "description": "Second"}]
+        )
+        self.assertEqual([t["title"] for t in tasks], ["Batch 1", "Batch 2"])
+        self.assertEqual(self.cli.create_tasks([]), [])
+
     def test_edi_task_metadata(self):
         with self.subTest("update title"):
             self.cli.edit_task(
@@ -112,88 +169,33 @@ class TestManiphestClient(TestCase):
             )
 
     def test_edit_task_subtask_parent(self):
-        self.cli.edit_task(
-            object_identifier=self.task["id"],
-            transactions=[
-                ManiphestTaskTransactionSubtasksAdd(
-                    type="subtasks.add",
-                    value=[self.task2["phid"]],
-                )
-            ],
-        )
-
-        self.cli.edit_task(
+        # The fixture tasks are shared, so unlink them again afterwards
+        self.addCleanup(
+            self.cli.edit_task,
             object_identifier=self.task["id"],
             transactions=[
-                ManiphestTaskTransactionSubtasksRemove(
-                    type="subtasks.remove",
-                    value=[self.task2["phid"]],
-                )
+                ManiphestTaskTransactionSubtasksSet(type="subtasks.set", value=[])
             ],
         )
 
-        # subtask remove is idempotent
-        self.cli.edit_task(
-            object_identifier=self.task["id"],
-            transactions=[
-                ManiphestTaskTransactionSubtasksRemove(
-                    type="subtasks.remove",
-                    value=[self.task2["phid"]],
-                )
-            ],
-        )
-
-        self.cli.edit_task(
-            object_identifier=self.task["id"],
-            transactions=[
-                ManiphestTaskTransactionSubtasksSet(
-                    type="subtasks.set",
-                    value=[self.task2["phid"]],
-                )
-            ],
-        )
+        for transactions in self.subtask_edits:
+            self.cli.edit_task(
+                object_identifier=self.task["id"], transactions=transactions
+            )
 
     def test_edit_task_parent(self):
-        self.cli.edit_task(
+        self.addCleanup(
+            self.cli.edit_task,
             object_identifier=self.task["id"],
             transactions=[
-                ManiphestTaskTransactionParentsAdd(
-                    type="parents.add",
-                    value=[self.task2["phid"]],
-                )
+                ManiphestTaskTransactionParentsSet(type="parents.set", value=[])
             ],
         )
 
-        self.cli.edit_task(
-            object_identifier=self.task["id"],
-            transactions=[
-                ManiphestTaskTransactionParentsRemove(
-                    type="parents.remove",
-                    value=[self.task2["phid"]],
-                )
-            ],
-        )
-
-        # parent remove is idempotent
-        self.cli.edit_task(
-            object_identifier=self.task["id"],
-            transactions=[
-                ManiphestTaskTransactionParentsRemove(
-                    type="parents.remove",
-                    value=[self.task2["phid"]],
-                )
-            ],
-        )
-
-        self.cli.edit_task(
-            object_identifier=self.task["id"],
-            transactions=[
-                ManiphestTaskTransactionParentsSet(
-                    type="parents.set",
-                    value=[self.task2["phid"]],
-                )
-            ],
-        )
+        for transactions in self.parent_edits:
+            self.cli.edit_task(
+                object_identifier=self.task["id"], transactions=transactions
+            )
 
     def test_search_tasks(self):
         """Test various search functionality"""
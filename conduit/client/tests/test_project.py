@@ -1,26 +1,87 @@
+import re
+import urllib.parse
+import uuid
 from unittest import TestCase
+from unittest.mock import patch
+
+import httpx
+import pytest
 
 from conduit.client.base import PhabricatorAPIError
 from conduit.client.project import ProjectClient
-from conduit.conduit import get_config
-
 
+# Whole-PHID patterns, compiled once for the structure assertions below
+PHID_RE = re.compile(r"\APHID-[A-Z]+-\w+\Z")
+PROJECT_PHID_RE = re.compile(r"\APHID-PROJ-\w+\Z")
+
+# Canned Conduit results, shaped like those of a Phorge server
+MOCK_PROJECT = {
+    "id": 1,
+    "type": "PROJ",
+    "phid": "PHID-PROJ-000",
+    "fields": {"name": "test_project_mock", "color": {"key": "blue"}},
+    "attachments": {},
+}
+MOCK_COLUMN = {
+    "id": "1",
+    "type": "PCOL",
+    "phid": "PHID-PCOL-000",
+    "fields": {"name": "Backlog", "projectPHID": "PHID-PROJ-000", "isDefault": True},
+    "attachments": {},
+}
+MOCK_RESPONSES = {
+    "project.search": {"data": [MOCK_PROJECT], "cursor": {}, "maps": {}, "query": {}},
+    "project.column.search": {
+        "data": [MOCK_COLUMN],
+        "cursor": {},
+        "maps": {},
+        "query": {},
+    },
+    "project.query": {"data": {"PHID-PROJ-000": MOCK_PROJECT}, "cursor": {}},
+    "project.edit": {"object": {"id": 1, "phid": "PHID-PROJ-000"}, "transactions": []},
+}
+
+
+@pytest.mark.usefixtures("phabricator_server")
 class TestProjectClient(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from conduit.conduit import get_config
+
+        config = get_config()
+        cls.cli = ProjectClient(config.url, config.token)
+        cls.addClassCleanup(cls.cli.close)
+
+        # A project shared by the tests that only need one to exist; tests
+        # that search by their own prefix or mutate a project create their own
+        name = f"test_project_{uuid.uuid4().hex[:8]}_shared"
+        cls.shared_project = cls.cli.create_project(
+            name=name,
+            description=f"Test project for unit testing: {name}",
+            icon="project",
+            color="blue",
+        )
+        cls.addClassCleanup(
+            cls.cli.edit_project,
+            object_identifier=cls.shared_project["object"]["id"],
+            transactions=[{"type": "status", "value": "archived"}],
+        )
+
     def setUp(self):
         super().setUp()
-        config = get_config()
-        self.cli = ProjectClient(config.url, config.token)
 
         # Store created projects for cleanup
         self.created_projects = []
-        self.test_project_prefix = f"test_project_{int(__import__('time').time())}"
+        # Project names are unique server-wide; a random prefix keeps tests
+        # running in parallel workers from colliding
+        self.test_project_prefix = f"test_project_{uuid.uuid4().hex[:8]}"
 
     def tearDown(self):
         """Clean up created test projects"""
         super().tearDown()
 
-        # Try to clean up created projects
-        for project_id in self.created_projects:
+        def archive(project_id):
             try:
                 # Archive projects instead of deleting to avoid issues
                 self.cli.edit_project(
@@ -31,30 +92,41 @@ class TestProjectClient(TestCase):
                 # Ignore cleanup errors
                 pass
 
+        # Try to clean up created projects, one request per project in parallel
+        self.cli._map_concurrently(archive, self.created_projects, 8)
+
     def _create_test_project(self, name_suffix=""):
         """Helper method to create a test project"""
-        name = (
+        return self._create_test_projects(name_suffix)[0]
+
+    def _create_test_projects(self, *name_suffixes):
+        """Helper method to create several test projects concurrently"""
+        names = [
             f"{self.test_project_prefix}_{name_suffix}"
             if name_suffix
             else self.test_project_prefix
-        )
-        result = self.cli.create_project(
-            name=name,
-            description=f"Test project for unit testing: {name}",
-            icon="project",
-            color="blue",
+            for name_suffix in name_suffixes
+        ]
+        results = self.cli.create_projects_bulk(
+            [
+                {
+                    "name": name,
+                    "description": f"Test project for unit testing: {name}",
+                    "icon": "project",
+                    "color": "blue",
+                }
+                for name in names
+            ]
         )
 
-        if "object" in result and "id" in result["object"]:
-            self.created_projects.append(result["object"]["id"])
+        for result in results:
+            if "object" in result and "id" in result["object"]:
+                self.created_projects.append(result["object"]["id"])
 
-        return result
+        return results
 
     def test_search_projects_basic(self):
         """Test basic project search without constraints"""
-        # Create a test project first
-        self._create_test_project("search_basic")
-
         # Search for projects
         results = self.cli.search_projects(limit=10)
 
@@ -78,8 +150,7 @@ class TestProjectClient(TestCase):
     def test_search_projects_with_constraints(self):
         """Test project search with various constraints"""
         # Create test projects
-        self._create_test_project("constraint_test_1")
-        self._create_test_project("constraint_test_2")
+        self._create_test_projects("constraint_test_1", "constraint_test_2")
 
         # Test search by name constraint
         results = self.cli.search_projects(
@@ -100,8 +171,7 @@ class TestProjectClient(TestCase):
     def test_search_projects_with_ordering(self):
         """Test project search with different ordering"""
         # Create test projects
-        self._create_test_project("order_test_1")
-        self._create_test_project("order_test_2")
+        self._create_test_projects("order_test_1", "order_test_2")
 
         # Test basic search (ordering not supported in current implementation)
         results = self.cli.search_projects(
@@ -114,8 +184,7 @@ class TestProjectClient(TestCase):
     def test_search_projects_pagination(self):
         """Test project search pagination"""
         # Create multiple test projects
-        for i in range(3):
-            self._create_test_project(f"pagination_{i}")
+        self._create_test_projects(*(f"pagination_{i}" for i in range(3)))
 
         # Test with small limit
         results = self.cli.search_projects(
@@ -142,7 +211,7 @@ class TestProjectClient(TestCase):
 
         # Verify the API call succeeded by checking the response structure
         self.assertIsInstance(result["object"]["id"], int)
-        self.assertTrue(result["object"]["phid"].startswith("PHID-PROJ-"))
+        self.assertRegex(result["object"]["phid"], PROJECT_PHID_RE)
 
     def test_create_project_minimal(self):
         """Test project creation with minimal parameters"""
@@ -155,7 +224,7 @@ class TestProjectClient(TestCase):
 
         # Verify the API call succeeded
         self.assertIsInstance(result["object"]["id"], int)
-        self.assertTrue(result["object"]["phid"].startswith("PHID-PROJ-"))
+        self.assertRegex(result["object"]["phid"], PROJECT_PHID_RE)
 
     def test_create_project_with_all_options(self):
         """Test project creation with all optional parameters"""
@@ -173,7 +242,7 @@ class TestProjectClient(TestCase):
 
         # Verify the API call succeeded
         self.assertIsInstance(result["object"]["id"], int)
-        self.assertTrue(result["object"]["phid"].startswith("PHID-PROJ-"))
+        self.assertRegex(result["object"]["phid"], PROJECT_PHID_RE)
 
     def test_edit_project_transactions(self):
         """Test project editing with various transactions"""
@@ -211,9 +280,6 @@ class TestProjectClient(TestCase):
 
     def test_search_columns_basic(self):
         """Test basic workboard column search"""
-        # Create a project first (projects should have default columns)
-        self._create_test_project("columns_test")
-
         # Search for columns
         results = self.cli.search_columns(limit=10)
 
@@ -233,9 +299,7 @@ class TestProjectClient(TestCase):
 
     def test_search_columns_with_constraints(self):
         """Test column search with project constraints"""
-        # Create a project first
-        project_result = self._create_test_project("columns_constraint")
-        project_phid = project_result["object"]["phid"]
+        project_phid = self.shared_project["object"]["phid"]
 
         # Search for columns in specific project
         results = self.cli.search_columns(
@@ -247,9 +311,6 @@ class TestProjectClient(TestCase):
 
     def test_query_projects_basic(self):
         """Test basic project query functionality."""
-        # Create a test project
-        self._create_test_project("query_basic")
-
         # Query projects
         results = self.cli.query_projects(constraints={"limit": 5})
 
@@ -265,7 +326,7 @@ class TestProjectClient(TestCase):
             first_project = results["data"][first_phid]
 
             # Verify PHID format
-            self.assertTrue(first_phid.startswith("PHID-PROJ-"))
+            self.assertRegex(first_phid, PROJECT_PHID_RE)
             # Verify project has expected fields
             self.assertIsInstance(first_project, dict)
             self.assertIn("id", first_project)
@@ -274,9 +335,6 @@ class TestProjectClient(TestCase):
 
     def test_query_projects_with_constraints(self):
         """Test project query with constraints (legacy method)"""
-        # Create a test project
-        self._create_test_project("query_constraint")
-
         # Test basic query without constraints that cause 500 errors
         # Just verify the method works and returns expected structure
         try:
@@ -296,9 +354,7 @@ class TestProjectClient(TestCase):
 
     def test_error_handling_invalid_transaction(self):
         """Test error handling for invalid transaction type"""
-        # Create a project first
-        create_result = self._create_test_project("error_test")
-        project_id = create_result["object"]["id"]
+        project_id = self.shared_project["object"]["id"]
 
         with self.assertRaises(PhabricatorAPIError):
             self.cli.edit_project(
@@ -325,9 +381,7 @@ class TestProjectClient(TestCase):
 
     def test_workboard_complete_workflow(self):
         """Test complete workboard workflow with project and columns."""
-        # Create a project
-        project_result = self._create_test_project("workboard_complete")
-        project_phid = project_result["object"]["phid"]
+        project_phid = self.shared_project["object"]["phid"]
 
         # Search for columns (may be empty in test environment)
         results = self.cli.search_columns(
@@ -376,7 +430,204 @@ class TestProjectClient(TestCase):
                 self.assertIsNotNone(fields[field])
 
         # PHID format validation
-        self.assertTrue(column["phid"].startswith("PHID-"))
+        self.assertRegex(column["phid"], PHID_RE)
 
         # ID validation
         self.assertIsInstance(column["id"], str)
+
+
+class TestProjectClientOffline(TestCase):
+    """ProjectClient tests against an in-memory Conduit transport, no server needed"""
+
+    def setUp(self):
+        super().setUp()
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            method = request.url.path.rsplit("/", 1)[-1]
+            params = dict(urllib.parse.parse_qsl(request.content.decode()))
+            if params.get("objectIdentifier") == "999999":
+                return httpx.Response(
+                    200,
+                    json={
+                        "result": None,
+                        "error_code": "ERR-CONDUIT-CORE",
+                        "error_info": "Object not found",
+                    },
+                )
+            return httpx.Response(200, json={"result": MOCK_RESPONSES[method]})
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(http_client.close)
+        self.cli = ProjectClient(
+            "http://test.example.com/api/", "test_token", http_client
+        )
+
+    def assertSent(self, method, params):
+        """Check the only request sent was `method` with these form params."""
+        self.assertEqual(len(self.requests), 1)
+        request = self.requests[0]
+        self.assertEqual(request.url.path, f"/api/{method}")
+        sent = dict(urllib.parse.parse_qsl(request.content.decode()))
+        self.assertEqual(sent.pop("api.token"), "test_token")
+        self.assertEqual(sent, params)
+
+    def test_create_project(self):
+        result = self.cli.create_project(
+            name="test_project_mock", description="Mock project", color="blue"
+        )
+
+        self.assertSent(
+            "project.edit",
+            {
+                "transactions[0][type]": "name",
+                "transactions[0][value]": "test_project_mock",
+                "transactions[1][type]": "description",
+                "transactions[1][value]": "Mock project",
+                "transactions[2][type]": "color",
+                "transactions[2][value]": "blue",
+            },
+        )
+        self.assertIn("id", result["object"])
+        self.assertRegex(result["object"]["phid"], PROJECT_PHID_RE)
+
+    def test_edit_project(self):
+        self.cli.edit_project(
+            object_identifier=1,
+            transactions=[{"type": "status", "value": "archived"}],
+        )
+
+        self.assertSent(
+            "project.edit",
+            {
+                "objectIdentifier": "1",
+                "transactions[0][type]": "status",
+                "transactions[0][value]": "archived",
+            },
+        )
+
+    def test_search_projects(self):
+        results = self.cli.search_projects(
+            constraints={"query": "test_project"}, limit=2
+        )
+
+        self.assertSent(
+            "project.search", {"limit": "2", "constraints[query]": "test_project"}
+        )
+        self.assertIn("cursor", results)
+        project = results["data"][0]
+        for key in ("id", "phid", "fields"):
+            self.assertIn(key, project)
+        self.assertIn("name", project["fields"])
+
+    def test_search_columns(self):
+        results = self.cli.search_columns(
+            constraints={"projects": ["PHID-PROJ-000"]}, limit=10
+        )
+
+        self.assertSent(
+            "project.column.search",
+            {"limit": "10", "constraints[projects][0]": "PHID-PROJ-000"},
+        )
+        for key in ("data", "cursor", "maps", "query"):
+            self.assertIn(key, results)
+        self.assertRegex(results["data"][0]["phid"], PHID_RE)
+
+    def test_query_projects(self):
+        results = self.cli.query_projects(constraints={"limit": 5})
+
+        self.assertSent("project.query", {"limit": "5"})
+        first_phid, first_project = next(iter(results["data"].items()))
+        self.assertRegex(first_phid, PROJECT_PHID_RE)
+        self.assertEqual(first_project["phid"], first_phid)
+
+    def test_api_error_propagates(self):
+        with self.assertRaises(PhabricatorAPIError) as cm:
+            self.cli.edit_project(
+                object_identifier=999999,
+                transactions=[{"type": "name", "value": "Should not work"}],
+            )
+
+        self.assertEqual(cm.exception.error_code, "ERR-CONDUIT-CORE")
+
+
+class TestProjectClientHelpers(TestCase):
+    """Caching and batching helpers of ProjectClient, with requests mocked out"""
+
+    def test_search_cache(self):
+        """Test ProjectClient caches read results until a write."""
+
+        client = ProjectClient(
+            api_url="https://test.example.com/api/",
+            api_token="test_token",
+            cache_ttl=60,
+        )
+
+        with patch.object(
+            ProjectClient, "_make_request", return_value={"data": [1]}
+        ) as mock_request:
+            first = client.search_projects(constraints={"name": "x"})
+            first["data"].append(2)
+            second = client.search_projects(constraints={"name": "x"})
+
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertEqual(second, {"data": [1]})
+
+            client.search_projects(constraints={"name": "y"})
+            self.assertEqual(mock_request.call_count, 2)
+
+            client.edit_project([{"type": "name", "value": "z"}], "PHID-PROJ-1")
+            client.search_projects(constraints={"name": "x"})
+            self.assertEqual(mock_request.call_count, 4)
+
+    def test_search_many(self):
+        """Test batched project searches keep the input order."""
+
+        client = ProjectClient(
+            api_url="https://test.example.com/api/", api_token="test_token"
+        )
+
+        def fake_request(method, params):
+            return {"data": [params["constraints[name]"]]}
+
+        with patch.object(ProjectClient, "_make_request", side_effect=fake_request):
+            results = client.search_projects_many(
+                [{"name": str(i)} for i in range(20)], concurrency=4
+            )
+
+        self.assertEqual([r["data"] for r in results], [[str(i)] for i in range(20)])
+        self.assertEqual(client.search_columns_many([]), [])
+
+    def test_create_projects_bulk(self):
+        """Test bulk project creation sends one edit per spec."""
+
+        client = ProjectClient(
+            api_url="https://test.example.com/api/", api_token="test_token"
+        )
+
+        with patch.object(
+            ProjectClient, "_make_request", side_effect=lambda m, p: dict(p)
+        ) as mock_request:
+            results = client.create_projects_bulk(
+                [{"name": "a"}, {"name": "b", "color": "red"}]
+            )
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(results[0]["transactions[0][value]"], "a")
+        self.assertEqual(results[1]["transactions[1][type]"], "color")
+
+    def test_cache_disabled_by_default(self):
+        """Test ProjectClient does not cache unless a TTL is given."""
+
+        client = ProjectClient(
+            api_url="https://test.example.com/api/", api_token="test_token"
+        )
+
+        with patch.object(
+            ProjectClient, "_make_request", return_value={"data": []}
+        ) as mock_request:
+            client.search_projects()
+            client.search_projects()
+
+            self.assertEqual(mock_request.call_count, 2)
@@ -1,18 +1,80 @@
+import time
 from unittest import TestCase
+from unittest.mock import patch
 
-from conduit.client.types import UserInfo, UserSearchAttachments, UserSearchConstraints
+import httpx
+import pytest
+
+from conduit.client import user as user_module
+from conduit.client.types import UserInfo, validate_api_response
 from conduit.client.user import UserClient
-from conduit.conduit import get_config
 
 
+@pytest.mark.usefixtures("phabricator_server", "phabricator_user")
 class TestUserClient(TestCase):
-    def setUp(self):
-        super().setUp()
-        config = get_config()
-        self.cli = UserClient(config.url, config.token)
+    # Current user info for reference, injected by the phabricator_user fixture
+    user: UserInfo
 
-        # Get current user info for reference
-        self.user: UserInfo = self.cli.whoami()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from conduit.conduit import get_config
+
+        config = get_config()
+        cls.cli = UserClient(config.url, config.token)
+        cls.addClassCleanup(cls.cli.close)
+        cls._search_results = None
+
+    def search_result(self, name):
+        """
+        Return the result of one search probe, running all of them on first use.
+
+        The probes are read-only, so they are issued together, concurrently,
+        once per class and each test asserts against its own result instead of
+        paying a round trip of its own. A probe that failed re-raises its error
+        only in the tests that read it.
+        """
+        cls = type(self)
+        if cls._search_results is None:
+            username = self.user["userName"]
+            probes = {
+                "basic": {"limit": 5},
+                "query_key": {"query_key": "active", "limit": 5},
+                "username": {"constraints": {"usernames": [username]}},
+                "admin": {"constraints": {"isAdmin": True}, "limit": 5},
+                "attachments": {
+                    "constraints": {"usernames": [username]},
+                    "attachments": {"availability": True},
+                },
+                "newest": {"order": "newest", "limit": 3},
+                "oldest": {"order": "oldest", "limit": 3},
+                "first_page": {"limit": 1},
+                "name_like": {"constraints": {"nameLike": "admin"}, "limit": 5},
+                "empty": {"constraints": {"usernames": ["nonexistent_user_12345"]}},
+            }
+
+            def run_probe(kwargs):
+                try:
+                    return cls.cli.search(**kwargs)
+                except Exception as e:
+                    return e
+
+            results = cls.cli._map_concurrently(
+                run_probe, probes.values(), max_workers=len(probes)
+            )
+            cls._search_results = dict(zip(probes, results))
+
+        result = cls._search_results[name]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def assertSearchResult(self, results):
+        """Check the top-level shape shared by every user.search result."""
+        self.assertTrue(
+            validate_api_response(results, "user_search"),
+            f"Unexpected user.search response: {results!r}",
+        )
 
     def test_whoami(self):
         """Test the existing whoami method"""
@@ -23,14 +85,12 @@ class TestUserClient(TestCase):
 
     def test_search_basic(self):
         """Test basic user search without constraints"""
-        results = self.cli.search(limit=5)
+        results = self.search_result("basic")
 
-        self.assertIn("data", results)
-        self.assertIn("cursor", results)
-        self.assertIsInstance(results["data"], list)
+        self.assertSearchResult(results)
 
         # Should have at least one user (current user)
-        self.assertGreater(len(results["data"]), 0)
+        self.assertTrue(results["data"])
 
         # Check structure of first result
         if results["data"]:
@@ -44,18 +104,16 @@ class TestUserClient(TestCase):
 
     def test_search_with_query_key(self):
         """Test search with builtin query key"""
-        results = self.cli.search(query_key="active", limit=5)
+        results = self.search_result("query_key")
 
-        self.assertIn("data", results)
-        self.assertIsInstance(results["data"], list)
+        self.assertSearchResult(results)
 
     def test_search_with_constraints(self):
         """Test search with constraints"""
         # Search by username
-        constraints: UserSearchConstraints = {"usernames": [self.user["userName"]]}
-        results = self.cli.search(constraints=constraints)
+        results = self.search_result("username")
 
-        self.assertIn("data", results)
+        self.assertSearchResult(results)
         self.assertEqual(len(results["data"]), 1)
 
         found_user = results["data"][0]
@@ -63,12 +121,11 @@ class TestUserClient(TestCase):
 
     def test_search_admin_constraint(self):
         """Test search with admin constraint"""
-        constraints: UserSearchConstraints = {"isAdmin": True}
-        results = self.cli.search(constraints=constraints)
+        results = self.search_result("admin")
 
-        self.assertIn("data", results)
+        self.assertSearchResult(results)
         # Should find at least one admin user
-        self.assertGreater(len(results["data"]), 0)
+        self.assertTrue(results["data"])
 
         # Check that found users have admin role
         for user in results["data"]:
@@ -77,12 +134,9 @@ class TestUserClient(TestCase):
 
     def test_search_with_attachments(self):
         """Test search with attachments"""
-        attachments: UserSearchAttachments = {"availability": True}
-        results = self.cli.search(
-            constraints={"usernames": [self.user["userName"]]}, attachments=attachments
-        )
+        results = self.search_result("attachments")
 
-        self.assertIn("data", results)
+        self.assertSearchResult(results)
         self.assertEqual(len(results["data"]), 1)
 
         user = results["data"][0]
@@ -92,26 +146,25 @@ class TestUserClient(TestCase):
     def test_search_with_ordering(self):
         """Test search with different orderings"""
         # Test with newest ordering
-        results = self.cli.search(order="newest", limit=3)
-        self.assertIn("data", results)
+        results = self.search_result("newest")
+        self.assertSearchResult(results)
 
         # Test with oldest ordering
-        results = self.cli.search(order="oldest", limit=3)
-        self.assertIn("data", results)
+        results = self.search_result("oldest")
+        self.assertSearchResult(results)
 
     def test_search_pagination(self):
         """Test search pagination"""
         # Get first page
-        first_page = self.cli.search(limit=1)
+        first_page = self.search_result("first_page")
 
-        self.assertIn("data", first_page)
-        self.assertIn("cursor", first_page)
+        self.assertSearchResult(first_page)
 
         # If there's more than one user, test pagination
         if first_page["cursor"].get("after"):
             second_page = self.cli.search(after=first_page["cursor"]["after"], limit=1)
 
-            self.assertIn("data", second_page)
+            self.assertSearchResult(second_page)
 
             # Results should be different
             if first_page["data"] and second_page["data"]:
@@ -121,24 +174,98 @@ class TestUserClient(TestCase):
 
     def test_search_name_like(self):
         """Test search with nameLike constraint"""
-        constraints: UserSearchConstraints = {"nameLike": "admin"}
-        results = self.cli.search(constraints=constraints)
+        results = self.search_result("name_like")
 
-        self.assertIn("data", results)
+        self.assertSearchResult(results)
 
         # Check that all results contain "admin" in username or real name
         for user in results["data"]:
-            username = user["fields"].get("username", "").lower()
-            real_name = user["fields"].get("realName", "").lower()
-            self.assertTrue(
-                "admin" in username or "admin" in real_name,
+            username = user["fields"].get("username", "")
+            real_name = user["fields"].get("realName", "")
+            # One casefolded string per user; NUL keeps a match from
+            # spanning the two fields
+            names = f"{username}\0{real_name}".casefold()
+            self.assertIn(
+                "admin",
+                names,
                 f"User {username} ({real_name}) does not contain 'admin'",
             )
 
     def test_search_empty_result(self):
         """Test search that should return no results"""
-        constraints: UserSearchConstraints = {"usernames": ["nonexistent_user_12345"]}
-        results = self.cli.search(constraints=constraints)
+        results = self.search_result("empty")
 
-        self.assertIn("data", results)
+        self.assertSearchResult(results)
         self.assertEqual(len(results["data"]), 0)
+
+
+class TestUserClientOffline(TestCase):
+    """UserClient tests against an in-memory Conduit transport, no server needed"""
+
+    def setUp(self):
+        super().setUp()
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            phid = f"PHID-USER-{len(self.requests)}"
+            return httpx.Response(200, json={"result": {"phid": phid}})
+
+        self.http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(self.http_client.close)
+        self.addCleanup(UserClient.clear_whoami_cache)
+        self.cli = UserClient(
+            "http://test.example.com/api/", "test_token", self.http_client
+        )
+
+    def test_whoami_cache(self):
+        with self.subTest("fresh_entry_reused"):
+            first = self.cli.whoami()
+            self.assertEqual(self.cli.whoami(), first)
+            self.assertIsNot(self.cli.whoami(), first)
+            self.assertEqual(len(self.requests), 1)
+
+        with self.subTest("shared_between_clients"):
+            other = UserClient(
+                "http://test.example.com/api/", "test_token", self.http_client
+            )
+            self.assertEqual(other.whoami(), first)
+            self.assertEqual(len(self.requests), 1)
+
+        with self.subTest("keyed_on_token"):
+            other = UserClient(
+                "http://test.example.com/api/", "other_token", self.http_client
+            )
+            self.assertEqual(other.whoami()["phid"], "PHID-USER-2")
+
+        with self.subTest("stale_entry_served_while_refreshing"):
+            with patch.object(user_module, "_WHOAMI_TTL", 0):
+                self.assertEqual(self.cli.whoami(), first)
+
+            deadline = time.monotonic() + 5
+            while user_module._whoami_refreshing and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(self.cli.whoami()["phid"], "PHID-USER-3")
+            self.assertEqual(len(self.requests), 3)
+
+        with self.subTest("least_recently_used_evicted"):
+            with patch.object(user_module, "_WHOAMI_CACHE_SIZE", 2):
+                # Touch test_token so other_token is the oldest entry
+                self.cli.whoami()
+                UserClient(
+                    "http://test.example.com/api/", "third_token", self.http_client
+                ).whoami()
+
+            self.assertEqual(
+                set(user_module._whoami_cache),
+                {
+                    ("http://test.example.com/api/", "test_token"),
+                    ("http://test.example.com/api/", "third_token"),
+                },
+            )
+
+        with self.subTest("cleared"):
+            UserClient.clear_whoami_cache()
+            self.cli.whoami()
+            self.assertEqual(len(self.requests), 5)
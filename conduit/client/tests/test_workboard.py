@@ -11,10 +11,16 @@ This module tests the Workboard functionality that currently works:
 import time
 import unittest
 
+import pytest
+
 from conduit.client.project import ProjectClient
 from conduit.client.maniphest import ManiphestClient
 
 
+# Every test here talks to the live Phorge server
+pytestmark = pytest.mark.integration
+
+
 class TestWorkboardExistingFeatures(unittest.TestCase):
     """Test existing Workboard features that are currently functional."""
 
@@ -1,16 +1,58 @@
+import copy
 import inspect
+import os
 import typing
-from functools import wraps
-from typing import Any, Callable, Dict, List, Literal, Optional, TypedDict, Union
+from functools import lru_cache, wraps
+from itertools import repeat
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 PHID = str
 PolicyID = str
 
+# Stands in for a missing key, since None is a possible value
+_MISSING = object()
+
+
+# Runtime type checks cost a signature bind and a walk of every argument per
+# call; deployments that trust their callers can switch them off
+_type_checks_enabled = os.getenv("PHABRICATOR_DISABLE_TYPECHECK", "").lower() not in (
+    "1",
+    "true",
+    "yes",
+)
+
+
+def enable_type_checks() -> None:
+    """Turn on argument and return value checks in validate_types."""
+    global _type_checks_enabled
+    _type_checks_enabled = True
+
+
+def disable_type_checks() -> None:
+    """Turn off validate_types checks; decorated functions run unchecked."""
+    global _type_checks_enabled
+    _type_checks_enabled = False
+
 
 def validate_types(func: Callable) -> Callable:
     """
     Decorator to validate function arguments and return values at runtime.
 
+    Checks are skipped while disabled with ``disable_type_checks()`` or the
+    ``PHABRICATOR_DISABLE_TYPECHECK`` environment variable.
+
     Args:
         func: Function to validate
 
@@ -18,37 +60,81 @@ def validate_types(func: Callable) -> Callable:
         Wrapped function with type validation
     """
 
+    # The signature never changes, so inspect it once instead of on every call
+    sig = inspect.signature(func)
+    parameters = sig.parameters.values()
+    positional_names = tuple(
+        p.name for p in parameters if p.kind is p.POSITIONAL_OR_KEYWORD
+    )
+    # Without positional-only or variadic parameters, arguments can be paired
+    # with their names directly instead of building a BoundArguments per call
+    simple_signature = all(
+        p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY) for p in parameters
+    )
+    arg_checks = None
+    return_check = None
+    bad_defaults = ()
+
+    def check_argument(param_name, value):
+        check = arg_checks.get(param_name)
+        if check is not None and not check[1](value):
+            raise TypeError(
+                f"Argument '{param_name}' expected type {check[0]}, "
+                f"got {type(value)} with value {value!r}"
+            )
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Get function signature and type hints
-        sig = inspect.signature(func)
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()
-
-        # Get type hints
-        type_hints = get_type_hints(func)
+        nonlocal arg_checks, return_check, bad_defaults
+
+        if not _type_checks_enabled:
+            return func(*args, **kwargs)
+
+        # Validators are built on first call, once any forward references
+        # can be resolved, and reused afterwards
+        if arg_checks is None:
+            type_hints = dict(get_type_hints(func))
+            if "return" in type_hints:
+                hint = type_hints.pop("return")
+                return_check = (hint, _validator_for(hint))
+            arg_checks = {
+                name: (hint, _validator_for(hint)) for name, hint in type_hints.items()
+            }
+            # Defaults never change, so only the ones that fail their own
+            # hint need checking when they are used
+            bad_defaults = tuple(
+                (p.name, p.default)
+                for p in parameters
+                if p.default is not p.empty
+                and p.name in arg_checks
+                and not arg_checks[p.name][1](p.default)
+            )
 
         # Validate arguments
-        for param_name, value in bound_args.arguments.items():
-            if param_name in type_hints and param_name != "return":
-                expected_type = type_hints[param_name]
-                if not _is_valid_type(value, expected_type):
-                    raise TypeError(
-                        f"Argument '{param_name}' expected type {expected_type}, "
-                        f"got {type(value)} with value {value!r}"
-                    )
+        if simple_signature and len(args) <= len(positional_names):
+            for param_name, value in zip(positional_names, args):
+                check_argument(param_name, value)
+            for param_name, value in kwargs.items():
+                check_argument(param_name, value)
+            passed = positional_names[: len(args)]
+            for param_name, default in bad_defaults:
+                if param_name not in kwargs and param_name not in passed:
+                    check_argument(param_name, default)
+        else:
+            bound_args = sig.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            for param_name, value in bound_args.arguments.items():
+                check_argument(param_name, value)
 
         # Call function
         result = func(*args, **kwargs)
 
         # Validate return value
-        if "return" in type_hints:
-            expected_return_type = type_hints["return"]
-            if not _is_valid_type(result, expected_return_type):
-                raise TypeError(
-                    f"Function '{func.__name__}' expected return type {expected_return_type}, "
-                    f"got {type(result)} with value {result!r}"
-                )
+        if return_check is not None and not return_check[1](result):
+            raise TypeError(
+                f"Function '{func.__name__}' expected return type {return_check[0]}, "
+                f"got {type(result)} with value {result!r}"
+            )
 
         return result
 
@@ -66,114 +152,222 @@ def _is_valid_type(value: Any, expected_type: Any) -> bool:
     Returns:
         True if value matches expected type, False otherwise
     """
+    return _validator_for(expected_type)(value)
+
+
+def _validator_for(expected_type: Any) -> Callable[[Any], bool]:
+    """Get the compiled validator for a type, caching it when hashable."""
+    try:
+        return _compile_validator(expected_type)
+    except TypeError:
+        return _compile_validator.__wrapped__(expected_type)
+
+
+@lru_cache(maxsize=None)
+def _compile_validator(expected_type: Any) -> Callable[[Any], bool]:
+    """
+    Build a validator specialized for one type.
+
+    The type is walked once here, so checking a value is a call to nested
+    closures rather than a fresh dispatch on ``__origin__`` every time.
+
+    Args:
+        expected_type: Expected type
+
+    Returns:
+        Function returning True if a value matches the type
+    """
     # Handle Any type
     if expected_type is Any:
-        return True
+        return _accept_any
+
+    # Handle TypedDict, which rejects isinstance() checks
+    if _is_typeddict(expected_type):
+        return _compile_typeddict_type(expected_type)
 
     # Handle regular types
     if not hasattr(expected_type, "__origin__"):
-        return isinstance(value, expected_type)
+        return lambda value: isinstance(value, expected_type)
 
-    # Handle generic types
-    origin = expected_type.__origin__
+    # Handle generic types (Union, List, Dict and Literal)
+    compile_generic = _GENERIC_COMPILERS.get(expected_type.__origin__)
+    if compile_generic is None:
+        return _reject_all
+    return compile_generic(expected_type)
 
-    # Handle Union types
-    if origin is Union:
-        return _handle_union_type(value, expected_type)
 
-    # Handle List types
-    if origin is list:
-        return _handle_list_type(value, expected_type)
+def _accept_any(value: Any) -> bool:
+    return True
 
-    # Handle Dict types
-    if origin is dict:
-        return _handle_dict_type(value, expected_type)
 
-    # Handle Literal types
-    if origin is Literal:
-        return _handle_literal_type(value, expected_type)
+def _reject_all(value: Any) -> bool:
+    return False
 
-    # Handle TypedDict
-    if _is_typeddict(expected_type):
-        return _handle_typeddict_type(value, expected_type)
 
-    return False
+def _is_plain_class(expected_type: Any) -> bool:
+    """Check if a type can be checked with a bare isinstance() call."""
+    return (
+        isinstance(expected_type, type)
+        and not hasattr(expected_type, "__origin__")
+        and not _is_typeddict(expected_type)
+    )
+
+
+def _compile_literal_type(expected_type: Any) -> Callable[[Any], bool]:
+    """Compile Literal type validation into a set lookup."""
+    allowed = expected_type.__args__
+    try:
+        allowed = frozenset(allowed)
+    except TypeError:
+        # Unhashable literal values keep the tuple scan
+        return lambda value: value in allowed
+
+    def check_literal(value: Any) -> bool:
+        try:
+            return value in allowed
+        except TypeError:
+            return False
 
+    return check_literal
+
+
+def _compile_union_type(expected_type: Any) -> Callable[[Any], bool]:
+    """Compile Union type validation."""
+    members = expected_type.__args__
 
-def _handle_union_type(value: Any, expected_type: Any) -> bool:
-    """Handle Union type validation."""
     # Handle Optional (Union[T, NoneType])
-    if type(None) in expected_type.__args__:
-        return value is None or _is_valid_type(
-            value, next(t for t in expected_type.__args__ if t is not type(None))
-        )
+    if type(None) in members:
+        rest = tuple(t for t in members if t is not type(None))
+        inner = _validator_for(rest[0] if len(rest) == 1 else Union[rest])
+        return lambda value: value is None or inner(value)
+
+    # Tagged unions of TypedDicts dispatch on the "type" key instead of
+    # trying every member in turn
+    tags = _union_tags(expected_type)
+    if tags is not None:
+        validators = {tag: _validator_for(member) for tag, member in tags.items()}
+
+        def check_tagged(value: Any) -> bool:
+            if not isinstance(value, dict):
+                return False
+            try:
+                validator = validators.get(value.get("type"))
+            except TypeError:
+                return False
+            return validator is not None and validator(value)
+
+        return check_tagged
+
+    # Plain classes are checked together with a single isinstance() call;
+    # only the remaining members need their own validators
+    classes = tuple(t for t in members if _is_plain_class(t))
+    validators = tuple(_validator_for(t) for t in members if t not in classes)
+    if not validators:
+        return lambda value: isinstance(value, classes)
+
     # Handle regular Union
-    return any(_is_valid_type(value, t) for t in expected_type.__args__)
+    return lambda value: isinstance(value, classes) or any(
+        validator(value) for validator in validators
+    )
 
 
-def _handle_list_type(value: Any, expected_type: Any) -> bool:
-    """Handle List type validation."""
-    if not isinstance(value, list):
-        return False
+@lru_cache(maxsize=None)
+def _union_tags(expected_type: Any) -> Optional[Mapping[Any, Any]]:
+    """
+    Map each Literal "type" tag of a union of TypedDicts to its member.
+
+    Returns:
+        Tag to member mapping, or None if some member is untagged or two
+        members share a tag
+    """
+    tags = {}
+    for member in expected_type.__args__:
+        if not _is_typeddict(member):
+            return None
+        tag = member.__annotations__.get("type")
+        if getattr(tag, "__origin__", None) is not Literal:
+            return None
+        for value in tag.__args__:
+            if tags.setdefault(value, member) is not member:
+                return None
+    return MappingProxyType(tags)
+
+
+def _compile_list_type(expected_type: Any) -> Callable[[Any], bool]:
+    """Compile List type validation."""
     element_type = expected_type.__args__[0]
-    return all(_is_valid_type(item, element_type) for item in value)
+    if _is_plain_class(element_type):
+        return lambda value: isinstance(value, list) and all(
+            map(isinstance, value, repeat(element_type))
+        )
 
+    check_item = _validator_for(element_type)
+    return lambda value: isinstance(value, list) and all(map(check_item, value))
 
-def _handle_dict_type(value: Any, expected_type: Any) -> bool:
-    """Handle Dict type validation."""
-    if not isinstance(value, dict):
-        return False
+
+def _compile_dict_type(expected_type: Any) -> Callable[[Any], bool]:
+    """Compile Dict type validation."""
     key_type, value_type = expected_type.__args__
-    return all(
-        _is_valid_type(k, key_type) and _is_valid_type(v, value_type)
-        for k, v in value.items()
+    check_key = _validator_for(key_type)
+    check_value = _validator_for(value_type)
+    return lambda value: isinstance(value, dict) and all(
+        check_key(k) and check_value(v) for k, v in value.items()
     )
 
 
-def _handle_literal_type(value: Any, expected_type: Any) -> bool:
-    """Handle Literal type validation."""
-    return value in expected_type.__args__
+# Validator builders for the supported generic types, keyed by __origin__
+_GENERIC_COMPILERS: Dict[Any, Callable[[Any], Callable[[Any], bool]]] = {
+    Union: _compile_union_type,
+    list: _compile_list_type,
+    dict: _compile_dict_type,
+    Literal: _compile_literal_type,
+}
 
 
 def _is_typeddict(expected_type: Any) -> bool:
     """Check if a type is a TypedDict."""
     return (
-        hasattr(expected_type, "__origin__")
-        and expected_type.__origin__ is dict
-        and hasattr(expected_type, "__annotations__")
+        isinstance(expected_type, type)
+        and issubclass(expected_type, dict)
+        and hasattr(expected_type, "__total__")
     )
 
 
-def _handle_typeddict_type(value: Any, expected_type: Any) -> bool:
-    """Handle TypedDict type validation."""
-    # Check basic structure
-    if not isinstance(value, dict):
-        return False
-
-    # Get required and optional fields
+def _compile_typeddict_type(expected_type: Any) -> Callable[[Any], bool]:
+    """Compile TypedDict type validation."""
     required_fields, optional_fields = _get_typeddict_fields(expected_type)
+    annotations = expected_type.__annotations__
+    required = tuple(
+        (name, _validator_for(annotations[name])) for name in required_fields
+    )
+    optional = tuple(
+        (name, _validator_for(annotations[name])) for name in optional_fields
+    )
 
-    # Check required fields
-    for field_name in required_fields:
-        if field_name not in value:
-            return False
-        if not _is_valid_type(
-            value[field_name], expected_type.__annotations__[field_name]
-        ):
+    def check_typeddict(value: Any) -> bool:
+        # Check basic structure, with every required key present
+        if not isinstance(value, dict) or not value.keys() >= required_fields:
             return False
 
-    # Check optional fields
-    for field_name in optional_fields:
-        if field_name in value and not _is_valid_type(
-            value[field_name], expected_type.__annotations__[field_name]
-        ):
-            return False
+        # Check required fields
+        for field_name, check in required:
+            if not check(value[field_name]):
+                return False
 
-    return True
+        # Check optional fields
+        for field_name, check in optional:
+            field_value = value.get(field_name, _MISSING)
+            if field_value is not _MISSING and not check(field_value):
+                return False
+
+        return True
 
+    return check_typeddict
 
-def _get_typeddict_fields(expected_type: Any) -> tuple[set, set]:
-    """Get required and optional fields from a TypedDict."""
+
+@lru_cache(maxsize=None)
+def _get_typeddict_fields(expected_type: Any) -> Tuple[frozenset, frozenset]:
+    """Get required and optional fields from a TypedDict, once per type."""
     required_fields = set()
     optional_fields = set()
 
@@ -187,7 +381,7 @@ def _get_typeddict_fields(expected_type: Any) -> tuple[set, set]:
         else:
             required_fields.add(field_name)
 
-    return required_fields, optional_fields
+    return frozenset(required_fields), frozenset(optional_fields)
 
 
 def get_type_hints(obj: Any) -> Dict[str, Any]:
@@ -207,6 +401,73 @@ def get_type_hints(obj: Any) -> Dict[str, Any]:
         return getattr(obj, "__annotations__", {})
 
 
+# map() with a repeated type runs the per-item isinstance() calls in C,
+# without a generator frame per element
+def _is_int_list(x: Any) -> bool:
+    return isinstance(x, list) and all(map(isinstance, x, repeat(int)))
+
+
+def _is_str_list(x: Any) -> bool:
+    return isinstance(x, list) and all(map(isinstance, x, repeat(str)))
+
+
+def _is_str(x: Any) -> bool:
+    return isinstance(x, str)
+
+
+def _is_int(x: Any) -> bool:
+    return isinstance(x, int)
+
+
+def _is_bool(x: Any) -> bool:
+    return isinstance(x, bool)
+
+
+# Per-entity constraint validators, built once at import time
+_CONSTRAINT_SCHEMAS: Dict[str, Dict[str, Callable[[Any], bool]]] = {
+    "user": {
+        "ids": _is_int_list,
+        "phids": _is_str_list,
+        "usernames": _is_str_list,
+        "nameLike": _is_str,
+        "isAdmin": _is_bool,
+        "isDisabled": _is_bool,
+        "isBot": _is_bool,
+        "createdStart": _is_int,
+        "createdEnd": _is_int,
+        "query": _is_str,
+    },
+    "task": {
+        "ids": _is_int_list,
+        "phids": _is_str_list,
+        "assigned": _is_str_list,
+        "authorPHIDs": _is_str_list,
+        "statuses": _is_str_list,
+        "priorities": _is_int_list,
+        "projects": _is_str_list,
+        "subscribers": _is_str_list,
+        "createdStart": _is_int,
+        "createdEnd": _is_int,
+        "modifiedStart": _is_int,
+        "modifiedEnd": _is_int,
+        "query": _is_str,
+        "hasParents": _is_bool,
+        "hasSubtasks": _is_bool,
+        "withUnassigned": _is_bool,
+        "ownerPHIDs": _is_str_list,
+        "spacePHIDs": _is_str_list,
+    },
+    "repository": {
+        "ids": _is_int_list,
+        "phids": _is_str_list,
+        "names": _is_str_list,
+        "callsigns": _is_str_list,
+        "vcs": lambda x: isinstance(x, str) and x in ("git", "hg", "svn"),
+        "status": lambda x: isinstance(x, str) and x in ("active", "inactive"),
+    },
+}
+
+
 def validate_search_constraints(
     constraints: Dict[str, Any], constraint_type: str
 ) -> bool:
@@ -220,79 +481,29 @@ def validate_search_constraints(
     Returns:
         True if constraints are valid, False otherwise
     """
-    constraint_schemas = {
-        "user": {
-            "ids": lambda x: isinstance(x, list) and all(isinstance(i, int) for i in x),
-            "phids": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "usernames": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "nameLike": lambda x: isinstance(x, str),
-            "isAdmin": lambda x: isinstance(x, bool),
-            "isDisabled": lambda x: isinstance(x, bool),
-            "isBot": lambda x: isinstance(x, bool),
-            "createdStart": lambda x: isinstance(x, int),
-            "createdEnd": lambda x: isinstance(x, int),
-            "query": lambda x: isinstance(x, str),
-        },
-        "task": {
-            "ids": lambda x: isinstance(x, list) and all(isinstance(i, int) for i in x),
-            "phids": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "assigned": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "authorPHIDs": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "statuses": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "priorities": lambda x: isinstance(x, list)
-            and all(isinstance(i, int) for i in x),
-            "projects": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "subscribers": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "createdStart": lambda x: isinstance(x, int),
-            "createdEnd": lambda x: isinstance(x, int),
-            "modifiedStart": lambda x: isinstance(x, int),
-            "modifiedEnd": lambda x: isinstance(x, int),
-            "query": lambda x: isinstance(x, str),
-            "hasParents": lambda x: isinstance(x, bool),
-            "hasSubtasks": lambda x: isinstance(x, bool),
-            "withUnassigned": lambda x: isinstance(x, bool),
-            "ownerPHIDs": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "spacePHIDs": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-        },
-        "repository": {
-            "ids": lambda x: isinstance(x, list) and all(isinstance(i, int) for i in x),
-            "phids": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "names": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "callsigns": lambda x: isinstance(x, list)
-            and all(isinstance(i, str) for i in x),
-            "vcs": lambda x: isinstance(x, str) and x in ["git", "hg", "svn"],
-            "status": lambda x: isinstance(x, str) and x in ["active", "inactive"],
-        },
-    }
-
-    if constraint_type not in constraint_schemas:
+    schema = _CONSTRAINT_SCHEMAS.get(constraint_type)
+    if schema is None:
         return False
 
-    schema = constraint_schemas[constraint_type]
-
     for key, value in constraints.items():
         # Accept additional constraint keys that are not explicitly
         # modelled in the schema to preserve forward compatibility.
-        if key not in schema:
-            continue
-        if not schema[key](value):
+        validator = schema.get(key)
+        if validator is not None and not validator(value):
             return False
 
     return True
 
 
+# Expected top-level (key, type) pairs for each response structure
+_SEARCH_RESPONSE = (("data", list), ("cursor", dict), ("query", dict), ("maps", dict))
+_RESPONSE_SCHEMAS: Dict[str, Tuple[Tuple[str, type], ...]] = {
+    "user_search": _SEARCH_RESPONSE,
+    "task_search": _SEARCH_RESPONSE,
+    "repository_search": (("data", list), ("cursor", dict)),
+}
+
+
 def validate_api_response(response: Dict[str, Any], expected_structure: str) -> bool:
     """
     Validate API response structure.
@@ -304,25 +515,6 @@ def validate_api_response(response: Dict[str, Any], expected_structure: str) ->
     Returns:
         True if response is valid, False otherwise
     """
-    structure_schemas = {
-        "user_search": {
-            "data": list,
-            "cursor": dict,
-            "query": dict,
-            "maps": dict,
-        },
-        "task_search": {
-            "data": list,
-            "cursor": dict,
-            "query": dict,
-            "maps": dict,
-        },
-        "repository_search": {
-            "data": list,
-            "cursor": dict,
-        },
-    }
-
     if expected_structure == "single_entity":
         # Legacy endpoints such as user.query return a dictionary keyed by
         # PHID instead of the modern {"result": {...}} wrapper. Accept any
@@ -330,15 +522,12 @@ def validate_api_response(response: Dict[str, Any], expected_structure: str) ->
         # responses.
         return isinstance(response, dict)
 
-    if expected_structure not in structure_schemas:
+    schema = _RESPONSE_SCHEMAS.get(expected_structure)
+    if schema is None or not isinstance(response, dict):
         return False
 
-    schema = structure_schemas[expected_structure]
-
-    for key, expected_type in schema.items():
-        if key not in response:
-            return False
-        if not isinstance(response[key], expected_type):
+    for key, expected_type in schema:
+        if not isinstance(response.get(key, _MISSING), expected_type):
             return False
 
     return True
@@ -348,9 +537,18 @@ def check_type_compatibility() -> Dict[str, Any]:
     """
     Check type compatibility across the codebase.
 
+    The report only depends on this module's definitions, so it is built once;
+    each caller gets its own copy to modify freely.
+
     Returns:
         Dictionary with type compatibility information
     """
+    return copy.deepcopy(_type_compatibility_report())
+
+
+@lru_cache(maxsize=1)
+def _type_compatibility_report() -> Dict[str, Any]:
+    """Build the shared compatibility report; callers must not modify it."""
     compatibility_report = {
         "typedict_definitions": [],
         "validation_rules": [],
@@ -1,12 +1,13 @@
-import hashlib
-import json
 import time
 from functools import wraps
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any, Dict, Optional
 
 import httpx
 from httpx import Limits, Timeout
 
+from conduit.client.base import _HTTP2, _POOL_LIMITS
+from conduit.client.cache import RequestCache
 from conduit.client.differential import DifferentialClient
 from conduit.client.diffusion import DiffusionClient
 from conduit.client.file import FileClient
@@ -46,9 +47,7 @@ class ClientConfig:
         self.connect_timeout = connect_timeout
         self.read_timeout = read_timeout
         self.write_timeout = write_timeout
-        self.pool_limits = pool_limits or Limits(
-            max_connections=100, max_keepalive_connections=20
-        )
+        self.pool_limits = pool_limits or _POOL_LIMITS
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.retry_backoff = retry_backoff
@@ -57,67 +56,81 @@ class ClientConfig:
         self.extra_config = kwargs
 
 
-class RequestCache:
-    """Simple request cache with TTL support."""
-
-    def __init__(self, ttl: int = 300):
-        self.ttl = ttl
-        self._cache = {}
-
-    @staticmethod
-    def _canonicalize(value: Any) -> str:
-        """Create a stable string representation suitable for cache keys."""
-        if value is None:
-            return ""
-        if isinstance(value, (dict, list, tuple, set)):
-            try:
-                return json.dumps(value, sort_keys=True, default=str)
-            except TypeError:
-                return str(value)
-        return str(value)
+# Global cache instance
+_request_cache = RequestCache()
 
-    def _generate_key(
+# Attribute name and class of every API client exposed by the unified
+# clients; they all share the owner's HTTP client
+_SUB_CLIENTS = {
+    "maniphest": ManiphestClient,
+    "differential": DifferentialClient,
+    "diffusion": DiffusionClient,
+    "project": ProjectClient,
+    "user": UserClient,
+    "file": FileClient,
+    "conduit": ConduitClient,
+    "harbormaster": HarbormasterClient,
+    "paste": PasteClient,
+    "phriction": PhrictionClient,
+    "remarkup": RemarkupClient,
+    "macro": MacroClient,
+    "flag": FlagClient,
+    "phid": PhidClient,
+}
+
+
+class _LazySubClients(object):
+    """Mixin building each API client in ``_SUB_CLIENTS`` on first access."""
+
+    maniphest: ManiphestClient
+    differential: DifferentialClient
+    diffusion: DiffusionClient
+    project: ProjectClient
+    user: UserClient
+    file: FileClient
+    conduit: ConduitClient
+    harbormaster: HarbormasterClient
+    paste: PasteClient
+    phriction: PhrictionClient
+    remarkup: RemarkupClient
+    macro: MacroClient
+    flag: FlagClient
+    phid: PhidClient
+
+    def _init_sub_clients(
         self,
-        method: str,
-        url: str,
-        params: dict = None,
-        data: dict = None,
-        json_payload: Any = None,
-        extra: Optional[Dict[str, Any]] = None,
-    ):
-        """Generate cache key from request parameters."""
-        key_parts = [
-            method.upper(),
-            url,
-            self._canonicalize(params),
-            self._canonicalize(data),
-            self._canonicalize(json_payload),
-            self._canonicalize(extra),
-        ]
-        key_data = "|".join(key_parts)
-        return hashlib.md5(key_data.encode()).hexdigest()
-
-    def get(self, key: str) -> Optional[Any]:
-        """Get cached response if still valid."""
-        if key in self._cache:
-            cached_data, timestamp = self._cache[key]
-            if time.time() - timestamp < self.ttl:
-                return cached_data
-            else:
-                del self._cache[key]
-        return None
-
-    def set(self, key: str, value: Any):
-        """Cache response with timestamp."""
-        self._cache[key] = (value, time.time())
-
-    def clear(self):
-        """Clear all cached responses."""
-        self._cache.clear()
+        api_url: str,
+        api_token: str,
+        http_client: httpx.Client,
+        **client_kwargs: Dict[str, Any],
+    ) -> None:
+        """
+        Record how to build the API clients without constructing any yet.
 
+        Args:
+            api_url: Base URL for the Phabricator API
+            api_token: API token for authentication
+            http_client: HTTP client shared by all API clients
+            **client_kwargs: Extra constructor arguments, keyed by attribute name
+        """
+        self._sub_client_args = (api_url, api_token, http_client, client_kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, so a client that has already
+        # been built is found in the instance dict without coming here
+        client_cls = _SUB_CLIENTS.get(name)
+        args = self.__dict__.get("_sub_client_args")
+        if client_cls is None or args is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
 
-# Global cache instance
-_request_cache = RequestCache()
+        api_url, api_token, http_client, client_kwargs = args
+        client = client_cls(
+            api_url, api_token, http_client, **client_kwargs.get(name, {})
+        )
+        # setdefault keeps one instance if two threads race to build it
+        return self.__dict__.setdefault(name, client)
 
 
 def retry_request(
@@ -237,7 +250,7 @@ def cached_request(ttl: int = 300):
     return decorator
 
 
-class EnhancedPhabricatorClient(object):
+class EnhancedPhabricatorClient(_LazySubClients):
     """Enhanced Phabricator client with improved HTTP configuration."""
 
     def __init__(
@@ -253,25 +266,32 @@ class EnhancedPhabricatorClient(object):
         retry_backoff: float = 2.0,
         enable_cache: bool = True,
         cache_ttl: int = 300,
+        http_client: Optional[httpx.Client] = None,
         **kwargs,
     ):
-        # Initialize enhanced HTTP client
-        self.http_client = httpx.Client(
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-                "User-Agent": "ModelContextProtocol/1.0 (Enhanced; +https://github.com/modelcontextprotocol/servers)",
-            },
-            timeout=Timeout(
-                connect=connect_timeout,
-                read=read_timeout,
-                write=write_timeout,
-                timeout=timeout,
-            ),
-            limits=Limits(max_connections=100, max_keepalive_connections=20),
-            follow_redirects=True,
-            proxy=kwargs.get("proxy"),
-            verify=not kwargs.get("disable_cert_verify", False),
-        )
+        # A caller-supplied HTTP client lets several clients share one
+        # connection pool; it is left open by close()
+        self._owns_client = http_client is None
+        if http_client is not None:
+            self.http_client = http_client
+        else:
+            self.http_client = httpx.Client(
+                headers={
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    "User-Agent": "ModelContextProtocol/1.0 (Enhanced; +https://github.com/modelcontextprotocol/servers)",
+                },
+                timeout=Timeout(
+                    connect=connect_timeout,
+                    read=read_timeout,
+                    write=write_timeout,
+                    timeout=timeout,
+                ),
+                limits=_POOL_LIMITS,
+                follow_redirects=True,
+                http2=_HTTP2,
+                proxy=kwargs.get("proxy"),
+                verify=not kwargs.get("disable_cert_verify", False),
+            )
 
         # Store configuration
         self.config = ClientConfig(
@@ -288,20 +308,12 @@ class EnhancedPhabricatorClient(object):
         )
 
         # Initialize client modules
-        self.maniphest = ManiphestClient(api_url, api_token, self.http_client)
-        self.differential = DifferentialClient(api_url, api_token, self.http_client)
-        self.diffusion = DiffusionClient(api_url, api_token, self.http_client)
-        self.project = ProjectClient(api_url, api_token, self.http_client)
-        self.user = UserClient(api_url, api_token, self.http_client)
-        self.file = FileClient(api_url, api_token, self.http_client)
-        self.conduit = ConduitClient(api_url, api_token, self.http_client)
-        self.harbormaster = HarbormasterClient(api_url, api_token, self.http_client)
-        self.paste = PasteClient(api_url, api_token, self.http_client)
-        self.phriction = PhrictionClient(api_url, api_token, self.http_client)
-        self.remarkup = RemarkupClient(api_url, api_token, self.http_client)
-        self.macro = MacroClient(api_url, api_token, self.http_client)
-        self.flag = FlagClient(api_url, api_token, self.http_client)
-        self.phid = PhidClient(api_url, api_token, self.http_client)
+        self._init_sub_clients(
+            api_url,
+            api_token,
+            self.http_client,
+            project={"cache_ttl": cache_ttl if enable_cache else None},
+        )
 
     @retry_request(max_retries=3, retry_delay=1.0, retry_backoff=2.0)
     @cached_request(ttl=300)
@@ -324,6 +336,9 @@ class EnhancedPhabricatorClient(object):
     def clear_cache(self):
         """Clear all cached requests."""
         _request_cache.clear()
+        # Only a project client that has been built can hold cached results
+        if "project" in self.__dict__:
+            self.project.clear_cache()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get client statistics and configuration."""
@@ -350,12 +365,52 @@ class EnhancedPhabricatorClient(object):
         }
 
     def close(self):
-        """Close the HTTP client."""
-        if self.http_client:
+        """Close the HTTP client if we own it."""
+        if self._owns_client and self.http_client:
             self.http_client.close()
 
 
-class PhabricatorClient(object):
+class _RejectCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that never stores a cookie."""
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+def _create_http_client(
+    proxy: Optional[str] = None,
+    disable_cert_verify: Optional[bool] = False,
+    store_cookies: bool = True,
+) -> httpx.Client:
+    """
+    Create the HTTP client used by a basic PhabricatorClient.
+
+    Args:
+        proxy: Optional proxy URL
+        disable_cert_verify: Skip TLS certificate verification
+        store_cookies: Keep cookies set by the server; disable this when the
+            client is shared by requests made with different API tokens
+
+    Returns:
+        Configured httpx client
+    """
+    cookies = None if store_cookies else CookieJar(policy=_RejectCookiesPolicy())
+    return httpx.Client(
+        headers={
+            "Content-Type": "application/x-www-form-urlencoded",
+            "User-Agent": "ModelContextProtocol/1.0 (Autonomous; +https://github.com/modelcontextprotocol/servers)",
+        },
+        timeout=30,
+        follow_redirects=True,
+        http2=_HTTP2,
+        limits=_POOL_LIMITS,
+        proxy=proxy,
+        verify=not disable_cert_verify,
+        cookies=cookies,
+    )
+
+
+class PhabricatorClient(_LazySubClients):
     """Backward-compatible Phabricator client with enhanced configuration."""
 
     def __init__(
@@ -367,8 +422,11 @@ class PhabricatorClient(object):
         timeout: float = 30.0,
         max_retries: int = 3,
         enable_cache: bool = True,
+        http_client: Optional[httpx.Client] = None,
         **kwargs,
     ):
+        self._owns_client = http_client is None
+
         # Use enhanced client if advanced features are requested
         if (
             timeout != 30.0
@@ -383,39 +441,21 @@ class PhabricatorClient(object):
                 enable_cache=enable_cache,
                 proxy=proxy,
                 disable_cert_verify=disable_cert_verify,
+                http_client=http_client,
                 **kwargs,
             )
             self.http_client = self._enhanced_client.http_client
             self._is_enhanced = True
+        elif http_client is not None:
+            self.http_client = http_client
+            self._is_enhanced = False
         else:
             # Use original simple client for backward compatibility
-            self.http_client = httpx.Client(
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "User-Agent": "ModelContextProtocol/1.0 (Autonomous; +https://github.com/modelcontextprotocol/servers)",
-                },
-                timeout=30,
-                follow_redirects=True,
-                proxy=proxy,
-                verify=not disable_cert_verify,
-            )
+            self.http_client = _create_http_client(proxy, disable_cert_verify)
             self._is_enhanced = False
 
         # Initialize client modules (same as before)
-        self.maniphest = ManiphestClient(api_url, api_token, self.http_client)
-        self.differential = DifferentialClient(api_url, api_token, self.http_client)
-        self.diffusion = DiffusionClient(api_url, api_token, self.http_client)
-        self.project = ProjectClient(api_url, api_token, self.http_client)
-        self.user = UserClient(api_url, api_token, self.http_client)
-        self.file = FileClient(api_url, api_token, self.http_client)
-        self.conduit = ConduitClient(api_url, api_token, self.http_client)
-        self.harbormaster = HarbormasterClient(api_url, api_token, self.http_client)
-        self.paste = PasteClient(api_url, api_token, self.http_client)
-        self.phriction = PhrictionClient(api_url, api_token, self.http_client)
-        self.remarkup = RemarkupClient(api_url, api_token, self.http_client)
-        self.macro = MacroClient(api_url, api_token, self.http_client)
-        self.flag = FlagClient(api_url, api_token, self.http_client)
-        self.phid = PhidClient(api_url, api_token, self.http_client)
+        self._init_sub_clients(api_url, api_token, self.http_client)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get client statistics if enhanced features are enabled."""
@@ -429,7 +469,7 @@ class PhabricatorClient(object):
             self._enhanced_client.clear_cache()
 
     def close(self):
-        if self.http_client:
+        if self._owns_client and self.http_client:
             self.http_client.close()
 
     def __enter__(self):
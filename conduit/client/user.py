@@ -1,4 +1,7 @@
-from typing import List, Optional, Union
+import copy
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from conduit.client.types import (
     UserInfo,
@@ -10,16 +13,87 @@ from conduit.client.base import BasePhabricatorClient
 
 from conduit.utils import build_search_params
 
+# Seconds a whoami() result is served without asking the server again
+_WHOAMI_TTL = 300.0
+
+# Most tokens kept in the whoami() cache; the least recently used is evicted
+# first so a long-running SSE server does not keep every token it has seen
+_WHOAMI_CACHE_SIZE = 256
+
+# whoami() results shared by every client, keyed on (api_url, api_token) and
+# kept in least recently used order
+_whoami_cache: Dict[Tuple[str, str], Tuple[float, UserInfo]] = {}
+_whoami_refreshing: Set[Tuple[str, str]] = set()
+_whoami_lock = threading.Lock()
+
 
 class UserClient(BasePhabricatorClient):
     def whoami(self) -> UserInfo:
         """
         Retrieve information about the logged-in user.
 
+        The identity behind a token rarely changes, so results are cached for
+        ``_WHOAMI_TTL`` seconds. Once an entry expires it is still returned
+        once while a background thread fetches a fresh copy. At most
+        ``_WHOAMI_CACHE_SIZE`` tokens are cached; see `clear_whoami_cache`.
+
         Returns:
             Current user information
         """
-        return self._make_request("user.whoami")
+        key = (self.api_url, self.api_token)
+        with _whoami_lock:
+            entry = _whoami_cache.pop(key, None)
+            if entry is not None:
+                # Re-insert to mark the entry as most recently used
+                _whoami_cache[key] = entry
+            refresh = (
+                entry is not None
+                and time.monotonic() - entry[0] >= _WHOAMI_TTL
+                and key not in _whoami_refreshing
+            )
+            if refresh:
+                _whoami_refreshing.add(key)
+
+        if entry is None:
+            user = self._fetch_whoami(key)
+        else:
+            user = entry[1]
+            if refresh:
+                threading.Thread(
+                    target=self._refresh_whoami, args=(key,), daemon=True
+                ).start()
+
+        # Callers may modify the result, so never hand out the cached object.
+        return copy.deepcopy(user)
+
+    def _fetch_whoami(self, key: Tuple[str, str]) -> UserInfo:
+        """Fetch the current user and store it in the whoami cache."""
+        user = self._make_request("user.whoami")
+        with _whoami_lock:
+            _whoami_cache.pop(key, None)
+            _whoami_cache[key] = (time.monotonic(), user)
+            if len(_whoami_cache) > _WHOAMI_CACHE_SIZE:
+                del _whoami_cache[next(iter(_whoami_cache))]
+        return user
+
+    def _refresh_whoami(self, key: Tuple[str, str]):
+        """Refresh a stale whoami entry, dropping it if the refresh fails."""
+        try:
+            self._fetch_whoami(key)
+        except Exception:
+            # A revoked token or closed client must not keep serving the old
+            # identity; the next call fetches again and reports the error.
+            with _whoami_lock:
+                _whoami_cache.pop(key, None)
+        finally:
+            with _whoami_lock:
+                _whoami_refreshing.discard(key)
+
+    @staticmethod
+    def clear_whoami_cache():
+        """Forget every cached whoami() result, e.g. after rotating tokens."""
+        with _whoami_lock:
+            _whoami_cache.clear()
 
     def search(
         self,
@@ -1,10 +1,12 @@
 import argparse
+import functools
 import os
 
 from fastmcp import FastMCP
 from fastmcp.server.dependencies import get_http_headers
 
 from conduit.client import PhabricatorClient
+from conduit.client.unified import _create_http_client
 from conduit.main_tools import register_tools
 
 
@@ -49,6 +51,16 @@ class ConduitApp:
         self.use_sse = use_sse
         self.mcp = FastMCP("Conduit")
         self._client = None
+        # SSE requests each get their own client for their token, but all of
+        # them share one connection pool instead of a new one per request.
+        # Cookies are never stored so no session state leaks between users.
+        self._http_client = (
+            _create_http_client(
+                config.proxy, config.disable_cert_verify, store_cookies=False
+            )
+            if use_sse
+            else None
+        )
 
     def get_client(self):
         """Get or create a Phabricator client instance."""
@@ -71,6 +83,7 @@ class ConduitApp:
                 http_token,
                 proxy=self.config.proxy,
                 disable_cert_verify=self.config.disable_cert_verify,
+                http_client=self._http_client,
             )
 
         # For stdio mode, use cached client (backward compatibility)
@@ -179,8 +192,14 @@ def main():
 
 
 # Backward compatibility functions
+@functools.lru_cache(maxsize=1)
 def get_config():
-    """Get configuration for backward compatibility."""
+    """
+    Get configuration for backward compatibility.
+
+    The configuration is read from the environment once and reused; call
+    ``get_config.cache_clear()`` after changing the environment variables.
+    """
     return PhabricatorConfig(require_token=False)
 
 
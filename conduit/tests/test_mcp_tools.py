@@ -10,11 +10,17 @@ import time
 import unittest
 from unittest.mock import Mock, patch
 
+import pytest
+
 from conduit.main_tools import register_tools
 from conduit.client.unified import PhabricatorClient
 from conduit.conduit import get_config
 
 
+# Every test here talks to the live Phorge server
+pytestmark = pytest.mark.integration
+
+
 class TestMCPTools(unittest.TestCase):
     """Test MCP tool functions."""
 
@@ -2,6 +2,8 @@ import os
 from unittest import TestCase
 from unittest.mock import patch
 
+import httpx
+
 from conduit.conduit import ConduitApp, PhabricatorConfig
 
 
@@ -51,6 +53,18 @@ class TestSSEModeSecurity(TestCase):
         # Verify that client instances are completely independent
         self.assertNotEqual(client_a, client_b)
 
+        # Both users' requests go through the same connection pool
+        self.assertIs(client_a.http_client, client_b.http_client)
+
+        # A session cookie set for one user is never replayed for another
+        response = httpx.Response(
+            200,
+            headers={"Set-Cookie": "phsid=user_a_session; Path=/"},
+            request=httpx.Request("POST", "https://test.example.com/api/"),
+        )
+        client_a.http_client.cookies.extract_cookies(response)
+        self.assertEqual(len(client_b.http_client.cookies), 0)
+
     @patch("conduit.conduit.get_http_headers")
     def test_sse_mode_multiple_user_isolation(self, mock_get_headers):
         """Test complete isolation of multiple users in SSE mode."""
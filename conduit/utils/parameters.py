@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 def build_search_params(
@@ -33,12 +34,10 @@ def build_search_params(
         params["queryKey"] = query_key
 
     if constraints:
-        flattened_constraints = dict(flatten_params(constraints, "constraints"))
-        params.update(flattened_constraints)
+        params.update(_flatten_constraints(constraints, "constraints"))
 
     if attachments:
-        flattened_attachments = dict(flatten_params(attachments, "attachments"))
-        params.update(flattened_attachments)
+        params.update(_flatten_constraints(attachments, "attachments"))
 
     if order:
         params["order"] = order
@@ -71,16 +70,10 @@ def build_transaction_params(
     Returns:
         Dictionary of built transaction parameters
     """
-    params = {}
-
-    if object_identifier:
-        params["objectIdentifier"] = object_identifier
+    params = {"objectIdentifier": object_identifier} if object_identifier else {}
 
     if transactions:
-        params = {
-            **{k: v for k, v in flatten_params(transactions, "transactions")},
-            **params,
-        }
+        params.update(flatten_params(transactions, "transactions"))
 
     # Add any additional parameters
     params.update(kwargs)
@@ -103,17 +96,102 @@ def flatten_params(d: Any, prefix: str = "") -> List[tuple]:
         List of (key, value) tuples for flattened parameters
     """
     params = []
-    if isinstance(d, dict):
+    _flatten_into(d, prefix, params)
+    return params
+
+
+# Leaf types emitted directly without recursing. Checked with ``type(v) in``
+# so subclasses (e.g. OrderedDict) still take the generic isinstance path.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _flatten_into(d: Any, prefix: str, params: List[tuple]) -> None:
+    """Append the flattened (key, value) pairs of ``d`` to ``params``."""
+    if type(d) is dict or isinstance(d, dict):
         for k, v in d.items():
-            if prefix:
-                new_prefix = f"{prefix}[{k}]"
+            new_prefix = f"{prefix}[{k}]" if prefix else str(k)
+            if type(v) in _SCALAR_TYPES:
+                params.append((new_prefix, v))
             else:
-                new_prefix = str(k)
-            params.extend(flatten_params(v, new_prefix))
-    elif isinstance(d, list):
+                _flatten_into(v, new_prefix, params)
+    elif type(d) is list or isinstance(d, list):
         for i, v in enumerate(d):
             new_prefix = f"{prefix}[{i}]"
-            params.extend(flatten_params(v, new_prefix))
+            if type(v) in _SCALAR_TYPES:
+                params.append((new_prefix, v))
+            else:
+                _flatten_into(v, new_prefix, params)
     else:
         params.append((prefix, d))
-    return params
+
+
+def _hashable(d: Any) -> Any:
+    """
+    Convert nested parameters into an immutable, hashable representation.
+
+    Dicts and lists are tagged so the original structure can be flattened
+    from the frozen form. Scalars carry their type so that values such as
+    ``True`` and ``1`` do not share a cache entry.
+
+    Args:
+        d: Dictionary, list, or primitive value to convert
+
+    Returns:
+        Hashable representation of the value
+    """
+    if isinstance(d, dict):
+        return (dict, tuple((k, _hashable(v)) for k, v in d.items()))
+    if isinstance(d, list):
+        return (list, tuple(_hashable(v) for v in d))
+    return (type(d), d)
+
+
+def _flatten_hashable(d: Any, prefix: str, params: List[tuple]) -> None:
+    """Flatten a value produced by ``_hashable`` into ``params``."""
+    kind, value = d
+    if kind is dict:
+        for k, v in value:
+            _flatten_hashable(v, f"{prefix}[{k}]" if prefix else str(k), params)
+    elif kind is list:
+        for i, v in enumerate(value):
+            _flatten_hashable(v, f"{prefix}[{i}]", params)
+    else:
+        params.append((prefix, value))
+
+
+@lru_cache(maxsize=256)
+def _flatten_cached(prefix: str, key: Any) -> Tuple[tuple, ...]:
+    """
+    Memoized flattening keyed on the ``_hashable`` form of the parameters.
+
+    Args:
+        prefix: Prefix for the parameter names
+        key: Hashable representation of the parameters
+
+    Returns:
+        Tuple of (key, value) tuples for flattened parameters
+    """
+    params = []
+    _flatten_hashable(key, prefix, params)
+    return tuple(params)
+
+
+def _flatten_constraints(d: Any, prefix: str = "") -> Tuple[tuple, ...]:
+    """
+    Flatten parameters, reusing the result for repeated identical inputs.
+
+    Paginated and repeated searches usually resend the same constraints and
+    attachments for every call, so the flattened form is cached. Values that cannot be hashed fall back
+    to the uncached ``flatten_params`` path.
+
+    Args:
+        d: Dictionary, list, or primitive value to flatten
+        prefix: Prefix for the parameter names
+
+    Returns:
+        Sequence of (key, value) tuples for flattened parameters
+    """
+    try:
+        return _flatten_cached(prefix, _hashable(d))
+    except TypeError:
+        return tuple(flatten_params(d, prefix))